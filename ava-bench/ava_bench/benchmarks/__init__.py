@@ -1,5 +1,25 @@
-from .simple_math import SimpleMathBenchmark
+import importlib
+from collections.abc import Mapping
 
-BENCHMARKS = {
-  "simple_math": SimpleMathBenchmark,
+# id -> "module:Class"; benchmark modules are only imported on first lookup,
+# so heavy framework dependencies (e.g. onnxruntime) never load for benchmarks that aren't run
+_REGISTRY = {
+  "simple_math": ".simple_math:SimpleMathBenchmark",
 }
+
+class _LazyRegistry(Mapping):
+  def __init__(self, specs):
+    self._specs = specs
+    self._loaded = {}
+
+  def __getitem__(self, benchmark_id):
+    if benchmark_id not in self._loaded:
+      module_name, class_name = self._specs[benchmark_id].split(":")
+      self._loaded[benchmark_id] = getattr(importlib.import_module(module_name, __name__), class_name)
+    return self._loaded[benchmark_id]
+
+  def __iter__(self): return iter(self._specs)
+
+  def __len__(self): return len(self._specs)
+
+BENCHMARKS = _LazyRegistry(_REGISTRY)
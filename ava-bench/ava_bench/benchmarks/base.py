@@ -1,16 +1,23 @@
+import inspect
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Optional
 
 class UniBench(ABC):
   BENCHMARK_ID: str = ""
   DESCRIPTION: str = ""
+  PROGRESS_INTERVAL_NS: int = 10_000_000  # forward at most ~100 progress reports/s to on_progress
   
   def __init__(self, config: Dict[str, Any]):
     self.config = config
+    self.on_progress: Optional[Callable[[float], None]] = None  # set by the caller (e.g. the dashboard)
+    self._last_progress_ns = 0
   
   @abstractmethod
   def initialize(self) -> bool: pass
   
+  # Returns the result dict. May instead be a generator yielding intermediate result dicts (the last is the result),
+  # which lets a sweep with early_stop abandon a clearly worse combination part-way through
   @abstractmethod
   def test(self) -> Dict[str, Any]: pass
   
@@ -18,3 +25,24 @@ class UniBench(ABC):
   def cleanup(self): pass
   
   def validate_config(self) -> bool: return True
+  
+  def run_to_completion(self, on_update: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Optional[Dict[str, Any]]:
+    # Call this rather than test() directly: it returns the final result dict whichever form test() takes.
+    # For a generator test(), on_update sees each yielded dict; returning True stops the run there and keeps that result
+    result = self.test()
+    if not inspect.isgenerator(result): return result
+    last = None
+    try:
+      for last in result:
+        if on_update is not None and on_update(last): break
+    finally: result.close()
+    return last
+  
+  def report_progress(self, percent: float) -> None:
+    # Benchmarks call this from test() at natural checkpoints; a no-op unless someone is listening.
+    # Tight loops may report far more often than anyone can display, so reports are rate-limited (completion always goes through)
+    if self.on_progress is None: return
+    now = time.monotonic_ns()
+    if now - self._last_progress_ns >= self.PROGRESS_INTERVAL_NS or percent >= 100:
+      self._last_progress_ns = now
+      self.on_progress(percent)
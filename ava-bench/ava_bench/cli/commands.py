@@ -1,14 +1,57 @@
 # ava_bench/cli/commands.py
 
+import asyncio
+import shlex
+import threading
 import time
+from contextlib import contextmanager
+from pathlib import Path
+
 import click
+from rich.live import Live
+from rich.markup import escape
+from rich.style import Style
+from rich.text import Text
 
 from ..core.orchestrator import Orchestrator
 from ..core.sweep import SweepConfig, Sweep
 from ..hardware.monitor import SystemMonitor
+from ..monitoring import create_monitor
+from ..runner import run_executable
+from ..utils import atomic_write, ensure_dir, write_json, dump_bytes
 from .dashboard import DashboardLayout
 from .display import display_error, display_success
 
+# One orchestrator per process; it holds no per-run state, so every command can share it
+_ORCH = Orchestrator()
+
+# Fixed dashboard stage pipelines (the dashboard pre-joins their past/next strings in set_stages)
+_STAGES = ("initializing", "loading", "computing", "finalizing", "complete")
+_SWEEP_STAGES = ("starting", "executing", "finishing", "complete")
+
+# Write buffer for the streamed monitoring export
+MONITORING_WRITE_BUFFER = 1 << 17
+
+# Minimum gap between dashboard repaints; changes inside one window are coalesced into a single frame
+DASHBOARD_REPAINT_INTERVAL = 0.25
+
+# Only the end of a command's output is kept in the result dict
+OUTPUT_TAIL_BYTES = 64 * 1024
+
+# Styles for the live metrics line, parsed once instead of from markup on every refresh
+_DIM = Style.parse("dim")
+_RUNNING_STYLE = Style.parse("yellow")
+_DONE_STYLE = Style.parse("green")
+_FAILED_STYLE = Style.parse("red")
+_SEP = (" │ ", _DIM)
+
+# Exact stream names shown on the live metrics line -> (slot, format)
+METRIC_MAP = {
+    'cpu.usage_percent': ('cpu', "{:.0f}%"),
+    'process.memory.rss_mb': ('memory', "{:.0f}MB"),
+    'thermal.cpu_temp': ('temp', "{:.0f}°C"),
+}
+
 
 @click.command()
 @click.argument('benchmark_id')
@@ -19,41 +62,37 @@ from .display import display_error, display_success
 def run(ctx, benchmark_id, iterations, output, monitor):    
     console = ctx.obj['console']
     quiet = ctx.obj['quiet']
+    pretty = ctx.obj['pretty']
     
     if quiet:
-        orch = Orchestrator()
-        bench = orch.create_benchmark(benchmark_id, {"iterations": iterations})
-        if bench.initialize():
-            result = bench.test()
-            bench.cleanup()
-            if output: _save_result(result, output, console, quiet)
+        result = _execute_one(_ORCH, benchmark_id, {"iterations": iterations})
+        if result is not None and output: _save_result(result, output, pretty)
         return
     
-    # Dashboard mode
-    system_monitor = SystemMonitor()
-    dashboard = DashboardLayout(console)
+    def run_with_dashboard(bench):
+        system_monitor = SystemMonitor()
+        dashboard = DashboardLayout(console)
+        # Dashboard frames read a background snapshot instead of blocking on psutil each refresh
+        system_monitor.start_snapshots()
+        try:
+            return _run_with_inline_dashboard(console, bench, benchmark_id, system_monitor, dashboard)
+        finally:
+            system_monitor.stop_snapshots()
     
     try:
-        # Setup benchmark
-        orch = Orchestrator()
-        config = {"iterations": iterations}
-        bench = orch.create_benchmark(benchmark_id, config)
+        # The monitor and dashboard are only built when the dashboard is shown
+        result = _execute_one(_ORCH, benchmark_id, {"iterations": iterations}, run_with_dashboard if monitor else None)
         
-        if not bench.initialize():
+        if result is None:
             display_error(console, f"Failed to initialize benchmark: {benchmark_id}")
             ctx.exit(1)
         
-        if monitor:
-            result = _run_with_inline_dashboard(console, bench, benchmark_id, system_monitor, dashboard)
-        else:
-            result = bench.test()
-        
-        bench.cleanup()
-        
         # Final success message
         display_success(console, f"Benchmark '{benchmark_id}' completed successfully!")
         
-        if output: _save_result(result, output, console, quiet)
+        if output:
+            _save_result(result, output, pretty)
+            console.print(f"Results saved to: {output}")
         
     except Exception as e:
         display_error(console, f"Benchmark failed: {str(e)}")
@@ -69,13 +108,14 @@ def run(ctx, benchmark_id, iterations, output, monitor):
 def sweep(ctx, config_path, name, output_dir, monitor):    
     console = ctx.obj['console']
     quiet = ctx.obj['quiet']
+    pretty = ctx.obj['pretty']
     
     if quiet:
-        orch = Orchestrator()
         config = SweepConfig.load(config_path)
-        sweep_runner = Sweep(orch)
-        results = sweep_runner.run(config_path)
-        if output_dir: _save_sweep_results(results, output_dir, name, console, quiet)
+        sweep_runner = Sweep(_ORCH)
+        # No per-combination log lines in quiet mode
+        results = sweep_runner.run(config, log=lambda line: None)
+        if output_dir: _save_sweep_results(results, output_dir, name, pretty)
         return
     
     console.print(f"[info]Loading sweep config: [benchmark]{config_path}[/benchmark][/info]")
@@ -87,147 +127,451 @@ def sweep(ctx, config_path, name, output_dir, monitor):
     try:
         # Load and validate config
         config = SweepConfig.load(config_path)
-        combinations = config.generate_combinations()
+        total = config.count_combinations()
         
-        console.print(f"[info]Generated [metric]{len(combinations)}[/metric] benchmark combinations[/info]")
+        console.print(f"[info]Generated [metric]{total}[/metric] benchmark combinations[/info]")
         stats = system_monitor.get_all_stats()
         console.print(f"[info]Running on: [benchmark]{stats['pi_model']}[/benchmark][/info]")
         console.print()
         
         # Setup sweep
-        orch = Orchestrator()
-        sweep_runner = Sweep(orch)
+        sweep_runner = Sweep(_ORCH)
         
         if monitor:
-            results = _run_sweep_with_inline_dashboard(console, sweep_runner, config_path, combinations, system_monitor, dashboard, name or "sweep")
+            system_monitor.start_snapshots()
+            try:
+                results = _run_sweep_with_inline_dashboard(console, sweep_runner, config, total, system_monitor, dashboard, name or "sweep")
+            finally:
+                system_monitor.stop_snapshots()
         else:
-            results = sweep_runner.run(config_path)
+            results = sweep_runner.run(config)
         
         # Display final results table (after dashboard)
         display_success(console, f"Sweep completed! {len(results)} benchmarks executed.")
         
         # Save results if requested
         if output_dir:
-            _save_sweep_results(results, output_dir, name, console, quiet)
+            console.print(f"Sweep results saved to: {_save_sweep_results(results, output_dir, name, pretty)}")
             
     except Exception as e:
         display_error(console, f"Sweep failed: {str(e)}")
         ctx.exit(1)
 
+def _execute_one(orch, benchmark_id, config, test=None):
+    """Create, initialize, test and clean up one benchmark; returns None if it fails to initialize"""
+    bench = orch.create_benchmark(benchmark_id, config)
+    if not bench.initialize():
+        return None
+    try:
+        return test(bench) if test else bench.run_to_completion()
+    finally:
+        bench.cleanup()
+
+
 def _run_with_inline_dashboard(console, bench, benchmark_id, system_monitor, dashboard):
     """Run benchmark with inline dashboard that refreshes in place"""
-    from rich.live import Live
-    
-    # Dashboard stages
-    stages = ["initializing", "loading", "computing", "finalizing", "complete"]
     
     # Initial dashboard setup
     dashboard.update_header(f"Running: {benchmark_id}")
-    dashboard.update_system_tiles(system_monitor.get_all_stats())
-    dashboard.update_progress(stages[0], 0, [], stages[1:])
+    dashboard.stats_source = system_monitor
+    dashboard.set_stages(_STAGES)
+    dashboard.update_stage(0, 0)
     dashboard.update_results()
     dashboard.update_footer("Starting benchmark...")
+    dashboard.sync()
     
-    # Use Live with transient=True for inline refresh
-    with Live(dashboard.render(), refresh_per_second=2, console=console, transient=True) as live:
+    # Frames are pushed only when dashboard data changed (no fixed-rate redraws); transient=False keeps the last frame on screen
+    with Live(dashboard, auto_refresh=False, console=console, transient=False) as live, _repaint_on_change(live, dashboard):
         
-        # Progress updates
-        update_points = [20, 40, 60, 80, 100]
-        for progress_percent in update_points:
-            time.sleep(0.2)  # Brief pause
-            
+        def on_progress(progress_percent):
             # Calculate current stage
-            stage_progress = progress_percent / 100 * len(stages)
-            current_stage_idx = min(int(stage_progress), len(stages) - 1)
-            current_stage = stages[current_stage_idx]
-            past_stages = stages[:current_stage_idx] if current_stage_idx > 0 else []
-            future_stages = stages[current_stage_idx + 1:] if current_stage_idx < len(stages) - 1 else []
+            stage_progress = progress_percent / 100 * len(_STAGES)
+            current_stage_idx = min(int(stage_progress), len(_STAGES) - 1)
             
-            # Update dashboard
-            dashboard.update_system_tiles(system_monitor.get_all_stats())
-            dashboard.update_progress(current_stage, progress_percent, past_stages, future_stages)
-            dashboard.update_footer(f"Progress: {progress_percent}% - {current_stage}")
-            
-            # Live will automatically refresh
-            live.update(dashboard.render())
+            # Update dashboard; the repaint thread picks the change up within one interval
+            dashboard.update_stage(current_stage_idx, progress_percent)
+            dashboard.update_footer(f"Progress: {progress_percent:.0f}% - {_STAGES[current_stage_idx]}")
+        
+        # Progress is driven by the benchmark's own checkpoints, not a synthetic stepper
+        bench.on_progress = on_progress
         
-        # Run actual benchmark
-        result = bench.test()
+        # Run actual benchmark (draining it if test() streams intermediate results)
+        result = bench.run_to_completion()
         
         # Final update
-        dashboard.update_progress("complete", 100, stages[:-1], [])
+        dashboard.update_stage(len(_STAGES) - 1, 100)
         dashboard.update_results(result)
         dashboard.update_footer("Benchmark completed!")
-        live.update(dashboard.render())
-        
-        time.sleep(1)  # Show final state briefly
+        live.refresh()
     
     # After Live exits, the final dashboard stays visible
     return result
 
 
-def _run_sweep_with_inline_dashboard(console, sweep_runner, config_path, combinations, system_monitor, dashboard, sweep_name):
+def _run_sweep_with_inline_dashboard(console, sweep_runner, config, total, system_monitor, dashboard, sweep_name):
     """Run sweep with inline dashboard that refreshes in place"""
-    from rich.live import Live
     
     # Initial dashboard setup
     dashboard.update_header(f"Sweep: {sweep_name}")
-    dashboard.update_system_tiles(system_monitor.get_all_stats())
-    dashboard.update_progress("starting", 0, [], ["loading", "executing", "finishing"])
+    dashboard.stats_source = system_monitor
+    dashboard.set_stages(_SWEEP_STAGES)
+    dashboard.update_stage(0, 0)
     dashboard.update_results()
-    dashboard.update_footer(f"Starting sweep with {len(combinations)} benchmarks...")
+    dashboard.update_footer(f"Starting sweep with {total} benchmarks...")
+    dashboard.sync()
     
-    # Use Live with transient=True for inline refresh
-    with Live(dashboard.render(), refresh_per_second=2, console=console, transient=True) as live:
+    # Frames are pushed only when dashboard data changed (no fixed-rate redraws); transient=False keeps the last frame on screen
+    with Live(dashboard, auto_refresh=False, console=console, transient=False) as live, _repaint_on_change(live, dashboard):
+        dashboard.update_stage(1, 0)
+        dashboard.update_footer(f"Running {total} benchmarks...")
         
-        # Sweep progress updates
-        total_benchmarks = len(combinations)
-        update_interval = max(1, total_benchmarks // 5)  # 5 updates max
-        
-        for i in range(0, total_benchmarks, update_interval):
-            progress_percent = int((i / total_benchmarks) * 100)
-            
-            # Update dashboard
-            dashboard.update_system_tiles(system_monitor.get_all_stats())
-            dashboard.update_progress("executing", progress_percent, ["starting"], ["finishing"])
-            dashboard.update_footer(f"Running benchmark {i+1}/{total_benchmarks}...")
-            
-            live.update(dashboard.render())
-            time.sleep(0.3)  # Brief pause
+        # Sweep log lines are held back while Live owns the terminal, then written in one print
+        log_lines = []
+        results = sweep_runner.run(config, log=log_lines.append)
         
-        results = sweep_runner.run(config_path)
-        
-        dashboard.update_progress("complete", 100, ["starting", "executing"], [])
+        dashboard.update_stage(len(_SWEEP_STAGES) - 1, 100)
         dashboard.update_footer(f"Completed {len(results)} benchmarks!")
-        live.update(dashboard.render())
-        
-        time.sleep(1)
+        live.refresh()
+    
+    if log_lines:
+        console.print("\n".join(log_lines), markup=False, highlight=False)
     
     return results
 
 
-def _save_result(result, output_path, console, quiet):
+@contextmanager
+def _repaint_on_change(live, dashboard, interval=DASHBOARD_REPAINT_INTERVAL):
+    """Repaint from a background thread at most once per interval, and only when the dashboard has changes"""
+    stop = threading.Event()
+    
+    def repaint_loop():
+        while not stop.wait(interval):
+            if dashboard.sync():
+                live.refresh()
+    
+    thread = threading.Thread(target=repaint_loop, name="ava-bench-dashboard", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _save_result(result, output_path, pretty=False):
     """Save benchmark result"""
-    import json
-    with open(output_path, 'w') as f:
-        json.dump(result, f, indent=2)
-    if not quiet:
-        console.print(f"Results saved to: {output_path}")
+    return write_json(result, output_path, pretty)
 
 
-def _save_sweep_results(results, output_dir, name, console, quiet):
+def _save_sweep_results(results, output_dir, name, pretty=False):
     """Save sweep results"""
-    import json
-    from pathlib import Path
-    
-    output_dir = Path(output_dir)
-    output_dir.mkdir(exist_ok=True)
+    output_dir = ensure_dir(output_dir)
     
     filename = f"{name or 'sweep'}_results.json"
     output_path = output_dir / filename
     
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    return write_json(results, output_path, pretty)
+
+
+@click.command()
+@click.argument('command', nargs=-1, required=True)
+@click.option('--timeout', '-t', type=int, help='Timeout in seconds')
+@click.option('--output', '-o', type=click.Path(), help='Output file for results')
+@click.option('--monitor/--no-monitor', default=True, help='Enable system monitoring')
+@click.option('--save-monitoring', type=click.Path(), help='Save monitoring data to file (.jsonl: one sample per line)')
+@click.pass_context
+def execute(ctx, command, timeout, output, monitor, save_monitoring):
+    """
+    Run an executable command with optional monitoring.
+    
+    Examples:
+        ava-bench execute echo "hello world"
+        ava-bench execute python -c "print('hello')"
+        ava-bench execute ls -la
+    """
+    console = ctx.obj['console']
+    quiet = ctx.obj['quiet']
+    
+    # argv goes to the process as-is (exec, no shell); quoting below is for display only
+    command_list = list(command)
+    
+    # Handle quiet mode simply
+    if quiet:
+        try:
+            monitor_instance = None
+            if monitor:
+                monitor_instance = create_monitor()
+            
+            result = run_executable(
+                command=command_list,
+                monitor=monitor_instance,
+                timeout=timeout,
+                output_file=output
+            )
+            
+            if result['metadata']['success']:
+                console.print("PASS")
+            else:
+                console.print("FAIL")
+                ctx.exit(1)
+                
+        except Exception as e:
+            console.print("FAIL")
+            ctx.exit(1)
+        return
+    
+    # Rich interactive mode
+    try:
+        # Phase 1: Fast overlapping setup
+        with console.status("[bold cyan]⠋ Preparing execution environment...") as status:
+            monitor_instance = None
+            
+            if monitor:
+                status.update("[bold cyan]⠙ Starting system monitoring...")
+                monitor_instance = create_monitor()
+            
+            status.update("[bold cyan]⠹ Environment ready")
+        
+        # Clear completion of setup
+        console.print("[bold cyan]✓[/bold cyan] Environment ready")
+        
+        # Phase 2: Static execution line + live metrics below
+        command_str = escape(shlex.join(command_list))
+        console.print(f"[bold green]Executing:[/bold green] [white]{command_str}[/white]")
+        
+        start_ns = time.monotonic_ns()
+        result = _run_with_live_metrics(
+            command_list, monitor_instance, timeout, output, console, ctx.obj['pretty']
+        )
+        total_time = (time.monotonic_ns() - start_ns) / 1e9
+        
+        # Phase 3: Saving phase (new line)
+        with console.status("[bold green]⠋ Saving results and exporting data...") as status:
+            
+            if save_monitoring and monitor_instance:
+                _save_monitoring_data(monitor_instance, save_monitoring, console)
+            
+            # Final status
+            if result['metadata']['success']:
+                status.update(f"[bold green]✓[/bold green] All complete ([cyan]{total_time:.1f}s total[/cyan])")
+            else:
+                status.update(f"[bold red]✗[/bold red] Execution failed ([cyan]{total_time:.1f}s total[/cyan])")
+                
+        # Show final result
+        if result['metadata']['success']:
+            console.print(f"[green]SUCCESS[/green] Command completed in [cyan]{total_time:.1f}s[/cyan]")
+        else:
+            console.print(f"[red]FAILED[/red] Command failed")
+            ctx.exit(1)
+            
+    except Exception as e:
+        console.print(f"[red]ERROR: {str(e)}[/red]")
+        ctx.exit(1)
+
+
+def _run_with_live_metrics(command_list, monitor_instance, timeout, output_file, console, pretty=False):
+    """Run executable with live metrics updates below static execution line."""
+    # Start monitoring if available
+    if monitor_instance:
+        monitor_instance.start_monitoring()
+    
+    # Live metrics updates (only the metrics line updates)
+    # Wall-clock start only goes into the result; durations come from the monotonic clock
+    start_time = time.time()
+    start_ns = time.monotonic_ns()
+    if console.is_terminal:
+        with console.status("") as status:
+            pid, returncode, stdout, stderr = asyncio.run(
+                _watch_process(command_list, monitor_instance, timeout, status, start_ns)
+            )
+    else:
+        # Nothing can redraw a status line on a pipe/log file; skip the spinner and its refresh timer
+        pid, returncode, stdout, stderr = asyncio.run(
+            _watch_process(command_list, monitor_instance, timeout, None, start_ns)
+        )
+    
+    # Show final frozen metrics state
+    duration = (time.monotonic_ns() - start_ns) / 1e9
+    final_metrics = _format_metrics(pid, monitor_instance)
+    
+    if monitor_instance:
+        # Stop monitoring
+        monitor_instance.stop_monitoring()
+    
+    # Print final frozen state
+    if returncode == 0:
+        console.print(_metrics_line(final_metrics, f"Completed in {duration:.1f}s", _DONE_STYLE))
+    else:
+        console.print(_metrics_line(final_metrics, f"Failed after {duration:.1f}s", _FAILED_STYLE))
+    
+    # Build result
+    result = {
+        'metadata': {
+            'command': command_list,
+            'duration_seconds': duration,
+            'success': returncode == 0,
+            'start_time': start_time
+        },
+        'results': {
+            'exit_code': returncode,
+            'success': returncode == 0,
+            'stdout': stdout,
+            'stderr': stderr
+        },
+        'monitoring': {
+            'summary': {},
+            # Only materialized for --output; --save-monitoring streams straight from the monitor.
+            # Columnar (timestamp/value arrays per metric) so the encoder writes flat arrays, not one dict per sample
+            'full_data': monitor_instance.export_columns() if monitor_instance and output_file else None
+        }
+    }
+    
+    # Save output if requested
+    if output_file:
+        _save_execute_result(result, output_file, pretty)
+    
+    return result
+
+
+async def _watch_process(command_list, monitor_instance, timeout, status, start_ns):
+    """Wait on the process from an event loop; metric refreshes are loop timers instead of a polling thread."""
+    process = await asyncio.create_subprocess_exec(
+        *command_list,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    loop = asyncio.get_running_loop()
+    refresh = None
+    
+    def update_metrics():
+        nonlocal refresh
+        duration = (time.monotonic_ns() - start_ns) / 1e9
+        
+        # Get live metrics if monitoring is available
+        metrics_text = _format_metrics(process.pid, monitor_instance)
+        
+        # Update only the metrics line with duration
+        status.update(_metrics_line(metrics_text, f"Running for {duration:.1f}s...", _RUNNING_STYLE))
+        refresh = loop.call_later(0.5, update_metrics)
+    
+    if status is not None:
+        update_metrics()
+    
+    # Drain both pipes as data arrives, keeping only a bounded tail so chatty long runs can't exhaust memory
+    stdout_tail, stderr_tail = bytearray(), bytearray()
+    try:
+        await asyncio.wait_for(asyncio.gather(
+            _drain_tail(process.stdout, stdout_tail),
+            _drain_tail(process.stderr, stderr_tail),
+            process.wait()
+        ), timeout)
+        returncode = process.returncode
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        returncode = -1
+        stderr_tail[:] = f"Command timed out after {timeout} seconds".encode()
+    finally:
+        if refresh is not None:
+            refresh.cancel()
+    
+    return process.pid, returncode, stdout_tail.decode(errors="replace"), stderr_tail.decode(errors="replace")
+
+
+def _metrics_line(metrics, message, style):
+    """Assemble '  │ <metrics> │ <message>' from pre-parsed styles."""
+    return Text.assemble("  ", ("│", _DIM), " ", metrics, _SEP, (message, style))
+
+
+def _format_metrics(pid, monitor_instance):
+    """Format the PID/CPU/memory/temperature metrics line."""
+    if not monitor_instance:
+        return Text(f"PID: {pid}")
+    
+    try:
+        values = {'cpu': "N/A", 'memory': "N/A", 'temp': "N/A"}
+        for metric_name, sample in monitor_instance.stream_manager.get_all_current_data().items():
+            entry = METRIC_MAP.get(metric_name)
+            if entry and sample:
+                values[entry[0]] = entry[1].format(sample.value)
+        
+        return Text.assemble(f"PID: {pid}", _SEP, f"CPU: {values['cpu']}", _SEP, f"Memory: {values['memory']}", _SEP, f"Temp: {values['temp']}")
+    except Exception:
+        return Text(f"PID: {pid}")
+
+
+async def _drain_tail(stream, tail, limit=OUTPUT_TAIL_BYTES):
+    """Read a pipe until EOF, keeping only its last `limit` bytes in `tail`."""
+    while True:
+        chunk = await stream.read(8192)
+        if not chunk:
+            return
+        tail += chunk
+        if len(tail) > limit:
+            del tail[:-limit]
+
+
+def _save_monitoring_data(monitor_instance, filepath, console):
+    """Stream monitoring data to a file one sample at a time.
+    
+    A .jsonl path gets one {"metric": ..., <sample>} object per line, with the summary in <name>.meta.json;
+    anything else gets a single JSON document with the summary alongside "metrics".
+    """
+    try:
+        output_path = Path(filepath)
+        ensure_dir(output_path.parent)
+        jsonl = output_path.suffix == '.jsonl'
+        
+        # Time range is tracked while writing instead of in a second pass; the sample count comes from the monitor
+        start_time, end_time = None, None
+        # 128KB buffer: the per-sample writes below are tiny, so coalesce them into few syscalls
+        with atomic_write(output_path, buffering=MONITORING_WRITE_BUFFER) as f:
+            if not jsonl:
+                f.write(b'{"metrics":{')
+            for i, (metric_type, samples) in enumerate(monitor_instance.iter_export()):
+                if jsonl:
+                    # Each row is the sample object with the metric name spliced in as its first key
+                    row_prefix = b'{"metric":' + dump_bytes(metric_type) + b','
+                else:
+                    f.write((b',' if i else b'') + dump_bytes(metric_type) + b':[')
+                for j, sample in enumerate(samples):
+                    if jsonl:
+                        f.write(row_prefix + dump_bytes(sample)[1:] + b'\n')
+                    else:
+                        f.write((b',' if j else b'') + dump_bytes(sample))
+                    timestamp = sample['timestamp']
+                    if start_time is None or timestamp < start_time:
+                        start_time = timestamp
+                    if end_time is None or timestamp > end_time:
+                        end_time = timestamp
+                if not jsonl:
+                    f.write(b']')
+            
+            # Duration comes from the monitor's integer start/stop markers, not from subtracting sample timestamps
+            duration_ns = monitor_instance.stream_manager.collection_duration_ns()
+            footer = {
+                'start_time': start_time or 0.0,
+                'end_time': end_time or 0.0,
+                'collection_duration': duration_ns / 1e9,
+                'duration_ns': duration_ns,
+                **monitor_instance.stream_manager.summary_counters()
+            }
+            if not jsonl:
+                # Close "metrics" and append the remaining keys (footer minus its opening brace)
+                f.write(b'},' + dump_bytes(footer)[1:])
+        
+        if jsonl:
+            write_json(footer, output_path.with_suffix('.meta.json'))
+        
+        # Don't print during status updates, just succeed silently
+        
+    except Exception as e:
+        console.print(f"[red]Failed to save monitoring data: {e}[/red]")
+
+
+def _save_execute_result(result, filepath, pretty=False):
+    """Save results to JSON file."""
+    output_path = Path(filepath)
+    ensure_dir(output_path.parent)
     
-    if not quiet:
-        console.print(f"Sweep results saved to: {output_path}")
\ No newline at end of file
+    write_json(result, output_path, pretty)
\ No newline at end of file
@@ -1,12 +1,80 @@
 # ava_bench/cli/dashboard.py
 
+from bisect import bisect_right
+from typing import NamedTuple
+
 from rich.panel import Panel
 from rich.text import Text
 from rich.columns import Columns
 from rich.console import Group
 
 
-def create_usage_bar(percent, width=20): return "█" * int(width * percent / 100) + "░" * (width - int(width * percent / 100))
+# Every bar the dashboard draws, built once per width: _BARS[width][filled_cells]
+_BARS = {}
+
+
+def _bar_table(width):
+    table = _BARS.get(width)
+    if table is None:
+        table = _BARS[width] = tuple("█" * i + "░" * (width - i) for i in range(width + 1))
+    return table
+
+
+# The tile (20) and progress (30) widths are built up front; any other width on first use
+_bar_table(20)
+_bar_table(30)
+
+
+def create_usage_bar(percent, width=20):
+    filled = int(width * percent / 100)
+    return _bar_table(width)[max(0, min(width, filled))]
+
+
+# Per-section dashboard data: fixed fields, attribute access, cheap equality for dirty checks
+class CPUData(NamedTuple):
+    usage: float = 0.0
+    freq: float = 0.0
+    load: float = 0.0
+    cores: int = 4
+
+
+class MemoryData(NamedTuple):
+    used: float = 0.0
+    total: float = 8.0
+    percent: float = 0.0
+    swap: float = 0.0
+
+
+class ThermalData(NamedTuple):
+    temp: float = 0.0
+    throttled: bool = False
+    color: str = "white"
+    status: str = "Normal"
+
+
+class ProgressData(NamedTuple):
+    current: str = "waiting"
+    percent: float = 0.0
+    past: str = ""  # already joined for display
+    future: str = ""
+
+
+class ResultsData(NamedTuple):
+    duration: float = 0.0
+    throughput: float = 0.0
+    status: str = "Unknown"
+    color: str = "white"
+
+
+_WAITING_RESULTS = ResultsData(status='waiting')
+
+
+# Classification thresholds as data: bisect_right(cuts, x) picks the bucket, the table gives its labels
+_THERMAL_CUTS = (60, 75)
+_THERMAL_BUCKETS = (("green", "Cool"), ("yellow", "Warm"), ("red", "Hot"))
+
+_DURATION_CUTS = (5, 10, 30)
+_RESULT_BUCKETS = (("Excellent", "green"), ("Good", "bright_green"), ("Fair", "yellow"), ("Poor", "red"))
 
 
 class DashboardLayout:
@@ -15,16 +83,30 @@ class DashboardLayout:
         
         # Store dashboard data
         self.header_text = "AVA-Bench Dashboard"
-        self.cpu_data = {}
-        self.memory_data = {}  
-        self.thermal_data = {}
-        self.progress_data = {}
-        self.results_data = {}
+        self.cpu_data = CPUData()
+        self.memory_data = MemoryData()
+        self.thermal_data = ThermalData()
+        self.progress_data = ProgressData()
+        self.stages = ()
+        self.results_data = ResultsData()
         self.footer_text = "Ready"
+        
+        # Optional SystemMonitor; when set, sync() pulls its latest snapshot into the system tiles
+        self.stats_source = None
+        
+        # Built panels per section; a section is only rebuilt after its data actually changes
+        self._panel_cache = {}
+        self._dirty = {'header', 'cpu', 'memory', 'thermal', 'system', 'progress', 'results', 'footer'}
+    
+    def _set(self, attr, value, section):
+        """Store new section data, marking the section dirty only if it differs"""
+        if getattr(self, attr) != value:
+            setattr(self, attr, value)
+            self._dirty.add(section)
     
     def update_header(self, title="AVA-Bench Dashboard"):
         """Update header"""
-        self.header_text = title
+        self._set('header_text', title, 'header')
     
     def update_system_tiles(self, stats):
         """Update system monitoring data"""
@@ -33,126 +115,177 @@ class DashboardLayout:
         temps = stats.get('temperature', {})
         
         # Store data for rendering
-        self.cpu_data = {
-            'usage': cpu.get('usage_percent', 0) or 0,
-            'freq': cpu.get('frequency_ghz', 0) or 0,
-            'load': cpu.get('load_1min', 0) or 0,
-            'cores': cpu.get('core_count', 4) or 0
-        }
+        self._set('cpu_data', CPUData(
+            usage=cpu.get('usage_percent', 0) or 0,
+            freq=cpu.get('frequency_ghz', 0) or 0,
+            load=cpu.get('load_1min', 0) or 0,
+            cores=cpu.get('core_count', 4) or 0
+        ), 'cpu')
         
-        self.memory_data = {
-            'used': memory.get('ram_used_gb', 0) or 0,
-            'total': memory.get('ram_total_gb', 8) or 0,
-            'percent': memory.get('ram_percent', 0) or 0,
-            'swap': memory.get('swap_used_gb', 0) or 0
-        }
+        self._set('memory_data', MemoryData(
+            used=memory.get('ram_used_gb', 0) or 0,
+            total=memory.get('ram_total_gb', 8) or 0,
+            percent=memory.get('ram_percent', 0) or 0,
+            swap=memory.get('swap_used_gb', 0) or 0
+        ), 'memory')
         
         cpu_temp = temps.get('cpu_temp', 0) or 0
         throttle = stats.get('throttling', {})
         is_throttled = throttle.get('is_throttled', False)
         
-        self.thermal_data = {
-            'temp': cpu_temp,
-            'throttled': is_throttled,
-            'color': "green" if cpu_temp < 60 else "yellow" if cpu_temp < 75 else "red",
-            'status': "Cool" if cpu_temp < 60 else "Warm" if cpu_temp < 75 else "Hot"
-        }
+        color, status = _THERMAL_BUCKETS[bisect_right(_THERMAL_CUTS, cpu_temp)]
+        self._set('thermal_data', ThermalData(
+            temp=cpu_temp,
+            throttled=is_throttled,
+            color=color,
+            status=status
+        ), 'thermal')
     
     def update_progress(self, current_stage, percent=0, past_stages=None, future_stages=None):
         """Update progress data"""
-        self.progress_data = {
-            'current': current_stage,
-            'percent': percent,
-            'past': past_stages or [],
-            'future': future_stages or []
-        }
+        self._set('progress_data', ProgressData(
+            current=current_stage,
+            percent=percent,
+            past=" -> ".join((past_stages or [])[-2:]),
+            future=" -> ".join((future_stages or [])[:2])
+        ), 'progress')
+    
+    def set_stages(self, stages):
+        """Fix the stage pipeline; the past/next strings for every position are joined once here"""
+        self.stages = tuple(stages)
+        self._past_strs = tuple(" -> ".join(self.stages[max(0, i - 2):i]) for i in range(len(self.stages)))
+        self._future_strs = tuple(" -> ".join(self.stages[i + 1:i + 3]) for i in range(len(self.stages)))
+    
+    def update_stage(self, stage_idx, percent=0):
+        """Update progress by position in the pipeline given to set_stages"""
+        self._set('progress_data', ProgressData(
+            current=self.stages[stage_idx],
+            percent=percent,
+            past=self._past_strs[stage_idx],
+            future=self._future_strs[stage_idx]
+        ), 'progress')
     
     def update_results(self, results=None):
         """Update results data"""
         if not results:
-            self.results_data = {'status': 'waiting'}
+            self._set('results_data', _WAITING_RESULTS, 'results')
             return
             
         duration = results.get('duration_seconds', 0)
         throughput = results.get('ops_per_second', 0)
         
-        if duration < 5 and throughput > 1000: status, color = "Excellent", "green"
-        elif duration < 10: status, color = "Good", "bright_green"  
-        elif duration < 30: status, color = "Fair", "yellow"
-        else: status, color = "Poor", "red"
+        bucket = bisect_right(_DURATION_CUTS, duration)
+        if bucket == 0 and throughput <= 1000: bucket = 1  # fast but low throughput only rates Good
+        status, color = _RESULT_BUCKETS[bucket]
         
-        self.results_data = {
-            'duration': duration,
-            'throughput': throughput,
-            'status': status,
-            'color': color
-        }
+        self._set('results_data', ResultsData(
+            duration=duration,
+            throughput=throughput,
+            status=status,
+            color=color
+        ), 'results')
     
     def update_footer(self, message="Ready"):
         """Update footer message"""
-        self.footer_text = message
+        self._set('footer_text', message, 'footer')
+    
+    def sync(self):
+        """Pull the latest stats snapshot; returns True if any section changed since the last render"""
+        if self.stats_source is not None:
+            self.update_system_tiles(self.stats_source.get_latest_stats())
+        return bool(self._dirty)
+    
+    def __rich__(self):
+        """Let Live(dashboard) repaint from current data whenever it refreshes"""
+        return self.render()
     
     def render(self):
         """Render dashboard as simple inline elements"""
+        # The tile row is rebuilt only when one of its tiles changed
+        if self._dirty & {'cpu', 'memory', 'thermal'}:
+            self._dirty.add('system')
         
-        # Header
-        header = Panel(Text(self.header_text, style="bold cyan", justify="center"), border_style="cyan")
-        
-        # System tiles row
-        cpu_text = Text()
-        cpu_text.append(f"CPU: {create_usage_bar(self.cpu_data.get('usage', 0))}\n", style="bright_blue")
-        cpu_text.append(f"{self.cpu_data.get('usage', 0):.0f}%\n", style="bright_blue")
-        cpu_text.append(f"Load: {self.cpu_data.get('load', 0):.1f}/{self.cpu_data.get('cores', 4)}\n", style="white")
-        cpu_text.append(f"Freq: {self.cpu_data.get('freq', 0):.1f}GHz", style="dim white")
-        cpu_tile = Panel(cpu_text, title="System", border_style="blue", width=25)
-        
-        memory_text = Text()
-        memory_text.append(f"RAM: {create_usage_bar(self.memory_data.get('percent', 0))}\n", style="bright_green")
-        memory_text.append(f"{self.memory_data.get('percent', 0):.0f}%\n", style="bright_green")
-        memory_text.append(f"{self.memory_data.get('used', 0):.1f}GB / {self.memory_data.get('total', 8):.1f}GB\n", style="white")
-        memory_text.append(f"Swap: {self.memory_data.get('swap', 0):.1f}GB", style="dim white")
-        memory_tile = Panel(memory_text, title="Memory", border_style="green", width=25)
-        
-        thermal_color = self.thermal_data.get('color', 'white')
-        thermal_text = Text()
-        thermal_text.append(f"CPU: {self.thermal_data.get('temp', 0):.0f}C\n", style=thermal_color)
-        thermal_text.append(f"Status: {self.thermal_data.get('status', 'Normal')}\n", style=thermal_color)
-        thermal_text.append("Throttled\n" if self.thermal_data.get('throttled') else "Normal\n", style="red" if self.thermal_data.get('throttled') else "white")
-        thermal_text.append("Stable", style="dim white")
-        thermal_tile = Panel(thermal_text, title="Thermal", border_style=thermal_color, width=25)
-        
-        system_row = Columns([cpu_tile, memory_tile, thermal_tile], equal=True)
-        
-        # Progress row
+        # Group everything together for inline rendering
+        return Group(
+            self._cached('header', self._render_header),
+            self._cached('system', self._render_system_tiles),
+            self._cached('progress', self._render_progress_panel),
+            self._cached('results', self._render_results_panel),
+            self._cached('footer', self._render_footer)
+        )
+    
+    def _cached(self, section, build):
+        """Return the cached panel for a section, rebuilding it if its data changed"""
+        if section in self._dirty or section not in self._panel_cache:
+            # Clear the flag before building so an update that lands mid-build marks it dirty again
+            self._dirty.discard(section)
+            self._panel_cache[section] = build()
+        return self._panel_cache[section]
+    
+    def _render_header(self):
+        return Panel(Text(self.header_text, style="bold cyan", justify="center"), border_style="cyan")
+    
+    def _render_system_tiles(self):
+        return Columns([
+            self._cached('cpu', self._render_cpu_tile),
+            self._cached('memory', self._render_memory_tile),
+            self._cached('thermal', self._render_thermal_tile)
+        ], equal=True)
+    
+    # Tiles are one formatted string per style run, so each tile builds three spans instead of four appends
+    def _render_cpu_tile(self):
+        cpu = self.cpu_data
+        cpu_text = Text.assemble(
+            (f"CPU: {create_usage_bar(cpu.usage)}\n{cpu.usage:.0f}%\n", "bright_blue"),
+            (f"Load: {cpu.load:.1f}/{cpu.cores}\n", "white"),
+            (f"Freq: {cpu.freq:.1f}GHz", "dim white")
+        )
+        return Panel(cpu_text, title="System", border_style="blue", width=25)
+    
+    def _render_memory_tile(self):
+        memory = self.memory_data
+        memory_text = Text.assemble(
+            (f"RAM: {create_usage_bar(memory.percent)}\n{memory.percent:.0f}%\n", "bright_green"),
+            (f"{memory.used:.1f}GB / {memory.total:.1f}GB\n", "white"),
+            (f"Swap: {memory.swap:.1f}GB", "dim white")
+        )
+        return Panel(memory_text, title="Memory", border_style="green", width=25)
+    
+    def _render_thermal_tile(self):
+        thermal = self.thermal_data
+        thermal_text = Text.assemble(
+            (f"CPU: {thermal.temp:.0f}C\nStatus: {thermal.status}\n", thermal.color),
+            ("Throttled\n", "red") if thermal.throttled else ("Normal\n", "white"),
+            ("Stable", "dim white")
+        )
+        return Panel(thermal_text, title="Thermal", border_style=thermal.color, width=25)
+    
+    def _render_progress_panel(self):
         progress_text = Text()
-        if self.progress_data.get('past'):
-            past_str = " -> ".join(self.progress_data['past'][-2:])
-            progress_text.append(f"Past: {past_str}\n", style="dim white")
+        if self.progress_data.past:
+            progress_text.append(f"Past: {self.progress_data.past}\n", style="dim white")
         
-        current = self.progress_data.get('current', 'waiting')
-        percent = self.progress_data.get('percent', 0)
+        current = self.progress_data.current
+        percent = self.progress_data.percent
         progress_bar = create_usage_bar(percent, 30)
         progress_text.append(f"Current: {current}\n", style="bold bright_cyan")
         progress_text.append(f"{progress_bar} {percent:.0f}%\n", style="bright_cyan")
         
-        if self.progress_data.get('future'):
-            future_str = " -> ".join(self.progress_data['future'][:2])
-            progress_text.append(f"Next: {future_str}", style="dim cyan")
+        if self.progress_data.future:
+            progress_text.append(f"Next: {self.progress_data.future}", style="dim cyan")
         
-        progress_panel = Panel(progress_text, title="Progress", border_style="cyan")
-        
-        # Results row
-        if self.results_data.get('status') == 'waiting':
+        return Panel(progress_text, title="Progress", border_style="cyan")
+    
+    def _render_results_panel(self):
+        if self.results_data.status == 'waiting':
             results_text = Text("Waiting for results...", style="dim white")
-            results_panel = Panel(results_text, title="Results", border_style="white")
+            return Panel(results_text, title="Results", border_style="white")
         else:
             results_text = Text()
-            results_text.append(f"Duration: {self.results_data.get('duration', 0):.3f}s  |  ", style="white")
-            results_text.append(f"Throughput: {self.results_data.get('throughput', 0):,.0f} ops/sec  |  ", style="white")
-            results_text.append(f"Status: {self.results_data.get('status', 'Unknown')}", style=self.results_data.get('color', 'white'))
-            results_panel = Panel(results_text, title="Live Results", border_style=self.results_data.get('color', 'white'))
-        
-        footer = Panel(Text(self.footer_text, style="bright_white", justify="center"), border_style="white")
-        
-        # Group everything together for inline rendering
-        return Group(header, system_row, progress_panel, results_panel, footer)
+            results_text.append(f"Duration: {self.results_data.duration:.3f}s  |  ", style="white")
+            results_text.append(f"Throughput: {self.results_data.throughput:,.0f} ops/sec  |  ", style="white")
+            results_text.append(f"Status: {self.results_data.status}", style=self.results_data.color)
+            return Panel(results_text, title="Live Results", border_style=self.results_data.color)
+    
+    def _render_footer(self):
+        return Panel(Text(self.footer_text, style="bright_white", justify="center"), border_style="white")
@@ -1,41 +1,68 @@
+import importlib
+from functools import lru_cache
+
 import click
-from rich.console import Console
-from rich.theme import Theme
-
-# Shared Rich console with custom theme
-console_theme = Theme({
-    "info": "cyan",
-    "warning": "yellow",
-    "error": "red bold",
-    "success": "green bold",
-    "benchmark": "blue bold",
-    "metric": "magenta",
-    "progress": "bright_blue"
-})
 
-console = Console(theme=console_theme)
 
-@click.group(invoke_without_command=True)
+@lru_cache(maxsize=None)
+def get_console():
+    """Shared Rich console with custom theme, built on first use so --version etc. never import Rich"""
+    from rich.console import Console
+    from rich.theme import Theme
+    
+    console_theme = Theme({
+        "info": "cyan",
+        "warning": "yellow",
+        "error": "red bold",
+        "success": "green bold",
+        "benchmark": "blue bold",
+        "metric": "magenta",
+        "progress": "bright_blue"
+    })
+    return Console(theme=console_theme)
+
+
+class LazyGroup(click.Group):
+    """Click group whose subcommands are imported only when they are looked up"""
+    
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # command name -> "module:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+    
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(':')
+            self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+# The command module pulls in Rich, NumPy and the benchmark stack; it loads only once a command runs
+@click.group(cls=LazyGroup, invoke_without_command=True, lazy_subcommands={
+    'run': 'ava_bench.cli.commands:run',
+    'sweep': 'ava_bench.cli.commands:sweep',
+    'execute': 'ava_bench.cli.commands:execute',
+})
 @click.version_option(version="0.1.0", prog_name="ava-bench")
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
 @click.option('--quiet', '-q', is_flag=True, help='Minimal output only')
+@click.option('--pretty/--no-pretty', default=False, help='Indent saved JSON for reading (default: compact)')
 @click.pass_context
-def cli(ctx, verbose, quiet):
+def cli(ctx, verbose, quiet, pretty):
     """🔥 AVA-Bench: ML Benchmarking Suite for Raspberry Pi"""
     
     # Ensure context object exists
     ctx.ensure_object(dict)
     ctx.obj['verbose'] = verbose
     ctx.obj['quiet'] = quiet
-    ctx.obj['console'] = console
+    ctx.obj['pretty'] = pretty
+    if ctx.invoked_subcommand is not None:
+        ctx.obj['console'] = get_console()
     
     # Show help if no command provided
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())
 
-
-# Import and register commands
-from .commands import run, sweep
-
-cli.add_command(run)
-cli.add_command(sweep)
@@ -3,61 +3,167 @@
 # DELETEME: Example config.yaml -> see /example/00_test_things
 
 import itertools
-from typing import Dict, List, Any
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 
-import yaml
+from ..utils import load_yaml
 
 class SweepConfig:
   def __init__(self, config: Dict[str, Any]):
     self.method = config.get('method', 'grid')
     self.parameters = config.get('parameters', {})
+    # Combinations run concurrently share cores, caches and the thermal budget, skewing each other's numbers,
+    # so parallel sweeps are opt-in ('auto' = one worker per core)
+    max_workers = config.get('max_workers', 1)
+    self.max_workers = (os.cpu_count() or 1) if max_workers == 'auto' else max(1, int(max_workers))
+    # Optional pruning: {'metric': ..., 'patience': 3, 'min_delta': 0.0, 'mode': 'max' | 'min'}.
+    # Only benchmarks whose test() yields intermediate results can be stopped early
+    self.early_stop = config.get('early_stop')
   
   @classmethod
   def load(cls, path: str): 
-    # TODO: Make this a safer abstraction in utils (we dont want to directly load data in this class!)
-    return cls(yaml.safe_load(open(path)))
+    return cls(load_yaml(path))
   
-  def generate_combinations(self) -> List[Dict[str, Any]]:
+  def generate_combinations(self) -> Iterator[Dict[str, Any]]:
+    # Combinations are produced lazily: a large grid is never resident all at once
     if self.method == 'grid': return self._grid_search()
     if self.method == 'random': return self._random_search()
     raise ValueError(f"Unknown method: {self.method}")
   
-  def _grid_search(self) -> List[Dict[str, Any]]:
-    keys, values = [], []
-    for k, v in self.parameters.items():
-      keys.append(k)
-      values.append(v['values'] if 'values' in v else [v['value']])
-    return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+  def count_combinations(self) -> int:
+    """How many combinations generate_combinations will yield, without generating them."""
+    if self.method == 'grid': return math.prod(len(values) for _, values in self._parameter_values())
+    if self.method == 'random': return self.parameters.get('_count', 10)
+    raise ValueError(f"Unknown method: {self.method}")
+  
+  def _parameter_values(self) -> List[Tuple[str, List[Any]]]:
+    # Underscore keys (e.g. _count) are settings, not parameters
+    return [(k, v['values'] if 'values' in v else [v['value']]) for k, v in self.parameters.items() if not k.startswith('_')]
   
-  def _random_search(self) -> List[Dict[str, Any]]:
+  def _grid_search(self) -> Iterator[Dict[str, Any]]:
+    items = self._parameter_values()
+    keys = tuple(k for k, _ in items)
+    for combo in itertools.product(*(values for _, values in items)):
+      yield dict(zip(keys, combo))
+  
+  def _random_search(self) -> Iterator[Dict[str, Any]]:
     # DELETEME: I am actually very sure we wont need this so this currently just lives here!
-    count = self.parameters.pop('_count', 10)
-    return [self._grid_search()[0] for _ in range(count)]  # simplified
+    # Each point samples every parameter independently; _seed makes a run reproducible
+    count = self.parameters.get('_count', 10)
+    rng = random.Random(self.parameters.get('_seed'))
+    items = self._parameter_values()
+    return ({k: rng.choice(values) for k, values in items} for _ in range(count))
+
+def _batched(iterable: Iterable, size: int) -> Iterator[list]:
+  # itertools.batched is 3.12+
+  it = iter(iterable)
+  while batch := list(itertools.islice(it, size)): yield batch
+
+def _is_worse(value: float, best: float, early_stop: Dict[str, Any]) -> bool:
+  min_delta = early_stop.get('min_delta', 0.0)
+  if early_stop.get('mode', 'max') == 'min': return value > best + min_delta
+  return value < best - min_delta
+
+class _EarlyStopWatch:
+  """on_update callback for UniBench.run_to_completion: records the metric at each step and asks to stop once
+  the run has trailed the best completed combination for `patience` consecutive steps.
+
+  Step k is compared with step k of the best combination, so a run is only abandoned for trailing
+  where the leader was at the same point, not for being early in its own progress.
+  """
+  def __init__(self, early_stop: Optional[Dict[str, Any]], best_curve: Tuple[float, ...]):
+    self.early_stop = early_stop
+    self.best_curve = best_curve
+    self.curve: List[float] = []
+    self.strikes = 0
+    self.stopped = False
+  
+  def __call__(self, result: Dict[str, Any]) -> bool:
+    if self.early_stop is None: return False
+    value = result.get(self.early_stop['metric'])
+    if value is None: return False
+    self.curve.append(value)
+    step = len(self.curve) - 1
+    if step >= len(self.best_curve): return False
+    self.strikes = self.strikes + 1 if _is_worse(value, self.best_curve[step], self.early_stop) else 0
+    self.stopped = self.strikes >= self.early_stop.get('patience', 3)
+    return self.stopped
+
+def _run_one(orchestrator, combo: Dict[str, Any], early_stop: Optional[Dict[str, Any]] = None,
+             best_curve: Tuple[float, ...] = ()) -> Optional[Tuple[Dict[str, Any], Tuple[float, ...]]]:
+  """Run a single combination -> (result, metric curve); None if the benchmark failed to initialize."""
+  combo = dict(combo)
+  benchmark_id = combo.pop('benchmark', 'simple_math') # FIXME: Handle inccorrect benchmark return better
+  bench = orchestrator.create_benchmark(benchmark_id, combo)
+  
+  if not bench.initialize(): return None
+  watch = _EarlyStopWatch(early_stop, best_curve)
+  try: result = bench.run_to_completion(watch)
+  finally: bench.cleanup()
+  # test() returned nothing (or a generator yielded nothing): recorded as-is, like any other result, with no curve
+  if result is None: return None, ()
+  if watch.stopped: result = dict(result, early_stopped=True)
+  # A plain dict result has no intermediate steps, so its curve is just the final value
+  if not watch.curve and early_stop and result.get(early_stop['metric']) is not None: watch.curve.append(result[early_stop['metric']])
+  return result, tuple(watch.curve)
+
+def _run_one_in_worker(orchestrator_cls, combo: Dict[str, Any], early_stop: Optional[Dict[str, Any]] = None,
+                       best_curve: Tuple[float, ...] = ()) -> Optional[Tuple[Dict[str, Any], Tuple[float, ...]]]:
+  # Module-level so it pickles; each worker process builds its own orchestrator
+  return _run_one(orchestrator_cls(), combo, early_stop, best_curve)
 
 class Sweep:
   def __init__(self, orchestrator):
     self.orchestrator = orchestrator
   
-  def run(self, config_path: str):
-    config = SweepConfig.load(config_path)
+  def run(self, config: Union[str, SweepConfig], log: Callable[[str], None] = print):
+    # Callers that already loaded the config (to count/validate combinations) pass it in instead of re-parsing the YAML
+    if not isinstance(config, SweepConfig): config = SweepConfig.load(config)
     combinations = config.generate_combinations()
+    total = config.count_combinations()
     
-    print(f"Running {len(combinations)} combinations...") # DELETEME: debug
+    # log lets a live dashboard collect these lines and print them once it is done, instead of repainting per line
+    log(f"Running {total} combinations...") # DELETEME: debug
     results = []
+    early_stop = config.early_stop
+    self.best_curve = ()  # early_stop metric at each step of the best completed combination
     
-    for i, combo in enumerate(combinations):
-      print(f"[{i+1}/{len(combinations)}] {combo}") # DELETEME: debug
-      
-      # Find benchmark type and create config
-      benchmark_id = combo.pop('benchmark', 'simple_math') # FIXME: Handle inccorrect benchmark return better
-      bench = self.orchestrator.create_benchmark(benchmark_id, combo)
-      
-      if bench.initialize():
-        result = bench.test()
-        bench.cleanup()
-        results.append(result)
-        print(f"  → {result}")
-      else:
-        print("  → Failed to initialize")
+    if config.max_workers > 1 and total > 1:
+      workers = min(config.max_workers, total)
+      # Submitted a few batches' worth at a time so the generator stays lazy; results come back in combination order
+      with ProcessPoolExecutor(max_workers=workers) as pool:
+        i = 0
+        for batch in _batched(combinations, workers * 4):
+          # A batch prunes against the best known when it was submitted
+          outcomes = pool.map(_run_one_in_worker, itertools.repeat(type(self.orchestrator)), batch,
+                              itertools.repeat(early_stop), itertools.repeat(self.best_curve))
+          for combo, result in zip(batch, outcomes):
+            i += 1
+            log(f"[{i}/{total}] {combo}") # DELETEME: debug
+            self._record(result, results, log, early_stop)
+      return results
+    
+    for i, combo in enumerate(combinations, 1):
+      log(f"[{i}/{total}] {combo}") # DELETEME: debug
+      self._record(_run_one(self.orchestrator, combo, early_stop, self.best_curve), results, log, early_stop)
+    
+    return results
+  
+  def _record(self, outcome, results, log, early_stop=None):
+    if outcome is None:
+      log("  → Failed to initialize")
+      return
+    result, curve = outcome
+    results.append(result)
+    if result is not None and result.get('early_stopped'):
+      log(f"  → Stopped early: {result}")
+      return
+    log(f"  → {result}")
     
-    return results
\ No newline at end of file
+    if not curve: return
+    minimize = early_stop.get('mode', 'max') == 'min'
+    if not self.best_curve or (curve[-1] < self.best_curve[-1] if minimize else curve[-1] > self.best_curve[-1]):
+      self.best_curve = curve
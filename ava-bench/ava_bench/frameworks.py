@@ -1,4 +1,13 @@
+import hashlib
+import importlib.util
+import os
+import platform
+import uuid
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any, List
 import numpy as np
 
@@ -30,70 +39,176 @@ class FrameworkAdapter(ABC):
     def get_framework_info(self) -> Dict[str, Any]:
         return {"id": self.FRAMEWORK_ID, "name": self.FRAMEWORK_NAME, "required_packages": self.REQUIRED_PACKAGES, "available": self.is_available()}
 
+# One generator for all synthetic inputs; it fills float32/float64 buffers directly, with no float64 temp + cast
+_RNG = np.random.default_rng()
+
+def _is_fresh(path: Path, source_path: Path) -> bool:
+    """Whether a derived model file exists and is at least as new as the model it was built from."""
+    return path.exists() and path.stat().st_mtime >= source_path.stat().st_mtime
+
+def _partial_path(path: Path) -> Path:
+    # Unique per writer (as in utils.atomic_write): parallel sweep workers building the same model never share a temp file
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+@lru_cache(maxsize=1)
+def _ort_installed() -> bool:
+    # find_spec only searches sys.path; nothing is imported or executed
+    return importlib.util.find_spec("onnxruntime") is not None
+
+@lru_cache(maxsize=1)
+def _ort_probe():
+    """Import onnxruntime and list its providers once per process -> (module, providers, error)."""
+    try:
+        import onnxruntime as ort
+        return ort, tuple(ort.get_available_providers()), None
+    except ImportError as e: return None, (), f"Import failed: {str(e)}"
+    except Exception as e: return None, (), f"ONNX Runtime check failed: {str(e)}"
+
 class ONNXRuntime(FrameworkAdapter):
     FRAMEWORK_ID = "onnxruntime"
     FRAMEWORK_NAME = "ONNX Runtime"
     REQUIRED_PACKAGES = ["onnxruntime"]
     
+    # Session builds cost seconds on a Pi; share them across adapter instances (e.g. sweep combinations)
+    _SESSION_CACHE: Dict[tuple, Any] = {}
+    # get_inputs() builds fresh NodeArg objects on every call; resolve the feed name once per session
+    _INPUT_NAMES = weakref.WeakKeyDictionary()
+    # Per session: (input array, its OrtValue, IOBinding). Bound once and reused while the same array is fed,
+    # so repeated runs skip the feed-dict path's per-call input validation/copy
+    _IO_BINDINGS = weakref.WeakKeyDictionary()
+    
     def is_available(self) -> bool:
-        try:
-            import onnxruntime as ort
-            ort.get_available_providers()
-            return True
-        except: return False
+        # Absent package: answer without attempting the import. Present: still import once, since a broken install must report False
+        return _ort_installed() and _ort_probe()[0] is not None
     
     def get_detection_info(self) -> Dict[str, Any]:
         info = {"framework_id": self.FRAMEWORK_ID, "available": False, "version": None, "error": None, 
                 "install_suggestion": "pip install onnxruntime>=1.20.1", "providers": [], "device_support": {}}
         
-        try:
-            import onnxruntime as ort
-            info["version"] = ort.__version__
-            providers = ort.get_available_providers()
-            info["providers"] = providers
-            info["device_support"] = {"cpu": "CPUExecutionProvider" in providers, "gpu": "CUDAExecutionProvider" in providers,
-                                    "directml": "DmlExecutionProvider" in providers, "coreml": "CoreMLExecutionProvider" in providers}
-            info["available"] = True
-        except ImportError as e: info["error"] = f"Import failed: {str(e)}"
-        except Exception as e: info["error"] = f"ONNX Runtime check failed: {str(e)}"
+        ort, providers, error = _ort_probe()
+        if ort is None:
+            info["error"] = error
+            return info
         
+        info["version"] = ort.__version__
+        info["providers"] = list(providers)
+        info["device_support"] = {"cpu": "CPUExecutionProvider" in providers, "gpu": "CUDAExecutionProvider" in providers,
+                                "directml": "DmlExecutionProvider" in providers, "coreml": "CoreMLExecutionProvider" in providers,
+                                "xnnpack": "XnnpackExecutionProvider" in providers}
+        info["available"] = True
         return info
     
     def load_model(self, model_path: str, **kwargs) -> Any:
         try:
             import onnxruntime as ort
             onnx_config = self.config.get('onnxruntime', {})
+            if onnx_config.get('quantize', False): model_path = self._quantized_model_path(model_path)
+            
+            providers = onnx_config.get('providers') or self._default_providers(ort)
+            optimization_level = onnx_config.get('optimization_level', 'all')
+            cache_session = onnx_config.get('cache_session', True)
+            cache_key = (model_path, tuple(str(p) for p in providers), optimization_level,
+                         onnx_config.get('inter_op_num_threads'), onnx_config.get('intra_op_num_threads'))
+            if cache_session and cache_key in self._SESSION_CACHE: return self._SESSION_CACHE[cache_key]
+            
             session_options = ort.SessionOptions()
             
             if 'inter_op_num_threads' in onnx_config: session_options.inter_op_num_threads = onnx_config['inter_op_num_threads']
             if 'intra_op_num_threads' in onnx_config: session_options.intra_op_num_threads = onnx_config['intra_op_num_threads']
             
-            optimization_level = onnx_config.get('optimization_level', 'all')
             opt_map = {'all': ort.GraphOptimizationLevel.ORT_ENABLE_ALL, 'basic': ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
                       'extended': ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED}
             session_options.graph_optimization_level = opt_map.get(optimization_level, ort.GraphOptimizationLevel.ORT_DISABLE_ALL)
             
-            providers = onnx_config.get('providers', ['CPUExecutionProvider'])
-            return ort.InferenceSession(model_path, sess_options=session_options, providers=providers)
+            # Graph fusion/constant folding is redone on every session build; persist the optimized graph once and reuse it.
+            # Higher levels bake in provider-specific fusions and layouts, so the saved graph is keyed by the providers too
+            partial_path = None
+            if onnx_config.get('cache_optimized_model', True) and optimization_level in opt_map:
+                source_path = Path(model_path)
+                providers_tag = hashlib.sha1(repr(cache_key[1]).encode()).hexdigest()[:8]
+                optimized_path = source_path.with_suffix(f".opt-{optimization_level}-{providers_tag}.onnx")
+                if _is_fresh(optimized_path, source_path):
+                    model_path = str(optimized_path)
+                    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+                else:
+                    partial_path = _partial_path(optimized_path)
+                    session_options.optimized_model_filepath = str(partial_path)
+            
+            try: session = ort.InferenceSession(model_path, sess_options=session_options, providers=providers)
+            except BaseException:
+                if partial_path is not None: partial_path.unlink(missing_ok=True)
+                raise
+            # Only publish the cached graph once ORT has fully written it, so an interrupted run never leaves a truncated model behind.
+            # Concurrent writers each publish a complete graph; whichever rename lands last wins
+            if partial_path is not None and partial_path.exists():
+                try: os.replace(partial_path, optimized_path)
+                except OSError:
+                    partial_path.unlink(missing_ok=True)
+                    if not _is_fresh(optimized_path, source_path): raise
+            if cache_session: self._SESSION_CACHE[cache_key] = session
+            return session
             
         except ImportError: raise RuntimeError("ONNX Runtime not available. Install with: pip install onnxruntime")
         except Exception as e: raise RuntimeError(f"Failed to load ONNX model '{model_path}': {str(e)}")
     
+    def _default_providers(self, ort) -> List[str]:
+        # XNNPACK ships NEON-tuned (depthwise) conv kernels that beat the default MLAS path on Pi/ARM boards.
+        # Other accelerators (NNAPI, ACL, ...) need device-specific options and must be requested via 'providers'.
+        if platform.machine().lower() in ('aarch64', 'arm64', 'armv7l') and 'XnnpackExecutionProvider' in _ort_probe()[1]:
+            return ['XnnpackExecutionProvider', 'CPUExecutionProvider']
+        return ['CPUExecutionProvider']
+    
+    def _quantized_model_path(self, model_path: str) -> str:
+        # Dynamic INT8 quantization is slow, so produce the sibling model once and reuse it on later loads
+        source_path = Path(model_path)
+        quantized_path = source_path.with_suffix(".int8.onnx")
+        if not _is_fresh(quantized_path, source_path):
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            partial_path = _partial_path(quantized_path)
+            try:
+                quantize_dynamic(str(source_path), str(partial_path), weight_type=QuantType.QInt8)
+                os.replace(partial_path, quantized_path)
+            except Exception:
+                partial_path.unlink(missing_ok=True)
+                # Another process may have published the same model meanwhile; that is as good as our own
+                if not _is_fresh(quantized_path, source_path): raise
+        return str(quantized_path)
+    
     def prepare_input(self, shape: List[int], dtype: str = "float32") -> np.ndarray:
         try:
             np_dtype = getattr(np, dtype)
-            if dtype.startswith('float'): return np.random.random(shape).astype(np_dtype)
-            elif dtype.startswith('int'): return np.random.randint(0, 255, shape, dtype=np_dtype)
-            else: return np.random.random(shape).astype(np_dtype)
+            # C-contiguous, dtype-exact buffers let ORT read the tensor in place instead of cloning it each run
+            if dtype in ('float32', 'float64'): return _RNG.random(shape, dtype=np_dtype)
+            elif dtype.startswith('int'): return _RNG.integers(0, 255, shape, dtype=np_dtype)
+            else: return np.ascontiguousarray(_RNG.random(shape), dtype=np_dtype)
         except Exception as e: raise RuntimeError(f"Failed to prepare input tensor: {str(e)}")
     
     def run_inference(self, model: Any, input_data: np.ndarray) -> np.ndarray:
         try:
-            input_name = model.get_inputs()[0].name
-            result = model.run(None, {input_name: input_data})
-            return result[0]
+            input_name = self._INPUT_NAMES.get(model)
+            if input_name is None: input_name = self._INPUT_NAMES[model] = model.get_inputs()[0].name
+            # Binding only pays off when the OrtValue can wrap the caller's own buffer and be reused across calls.
+            # A non-contiguous array would need a fresh copy (and so a fresh binding) every run; let run() copy it instead
+            binding = self._io_binding(model, input_name, input_data) if input_data.flags.c_contiguous else None
+            if binding is None: return model.run(None, {input_name: input_data})[0]
+            model.run_with_iobinding(binding)
+            return binding.copy_outputs_to_cpu()[0]
         except Exception as e: raise RuntimeError(f"Inference failed: {str(e)}")
     
+    def _io_binding(self, model: Any, input_name: str, input_data: np.ndarray) -> Any:
+        # The OrtValue wraps input_data's memory, so in-place updates to the array are seen without rebinding
+        cached = self._IO_BINDINGS.get(model)
+        if cached is not None and cached[0] is input_data: return cached[2]
+        ort = _ort_probe()[0]
+        if ort is None or not hasattr(model, 'io_binding'): return None
+        
+        ort_value = ort.OrtValue.ortvalue_from_numpy(input_data)
+        binding = model.io_binding()
+        binding.bind_ortvalue_input(input_name, ort_value)
+        for output in model.get_outputs(): binding.bind_output(output.name, 'cpu')
+        self._IO_BINDINGS[model] = (input_data, ort_value, binding)
+        return binding
+    
     def get_model_metadata(self, model: Any) -> Dict[str, Any]:
         try:
             inputs, outputs = model.get_inputs(), model.get_outputs()
@@ -109,9 +224,14 @@ class ONNXRuntime(FrameworkAdapter):
         except Exception as e: raise RuntimeError(f"Failed to extract model metadata: {str(e)}")
     
     def release_model(self, model: Any) -> None:
+        # The session itself may live on in _SESSION_CACHE; its binding shouldn't pin the last input array
+        self._IO_BINDINGS.pop(model, None)
         if hasattr(model, 'end_profiling'):
             try: model.end_profiling()
             except: pass
+    
+    @classmethod
+    def clear_session_cache(cls) -> None: cls._SESSION_CACHE.clear()
 
 _FRAMEWORKS = {"onnxruntime": ONNXRuntime}
 
@@ -122,8 +242,13 @@ def get_framework_adapter(framework_id: str, config: dict) -> FrameworkAdapter:
 
 def list_frameworks() -> List[str]: return list(_FRAMEWORKS.keys())
 
+def _detect(cls) -> Dict[str, Any]: return cls({}).get_detection_info()
+
 def get_all_framework_info() -> Dict[str, Dict[str, Any]]:
-    return {fid: cls({}).get_detection_info() for fid, cls in _FRAMEWORKS.items()}
+    # Each probe imports its own library (shared-lib loads release the GIL), so run them side by side
+    if len(_FRAMEWORKS) == 1: return {fid: _detect(cls) for fid, cls in _FRAMEWORKS.items()}
+    with ThreadPoolExecutor(max_workers=len(_FRAMEWORKS)) as pool:
+        return dict(zip(_FRAMEWORKS, pool.map(_detect, _FRAMEWORKS.values())))
 
 def check_framework_availability(framework_id: str) -> bool:
     return framework_id in _FRAMEWORKS and _FRAMEWORKS[framework_id]({}).is_available()
\ No newline at end of file
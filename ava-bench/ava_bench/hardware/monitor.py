@@ -1,11 +1,45 @@
 # WARNING: this is just a basic class I create to get a feel for what the api for a basic system status monitor should look like
 # this was soley made to ensure for a functional TUI and has no other purpose! 
 
+import os
 import time
 import psutil
 import platform
+import subprocess
+import threading
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, Any
 
+# Platform capability, resolved once instead of on every sample
+_HAS_LOADAVG = hasattr(psutil, 'getloadavg')
+
+# How long a direct get_latest_stats() read is reused when no snapshot thread is running
+STATS_TTL_SECONDS = 0.5
+
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+THROTTLED_PATH = '/sys/devices/platform/soc/soc:firmware/get_throttled'
+
+# get_throttled bit per reported flag
+_THROTTLE_BITS = (('is_throttled', 0x1), ('is_undervolted', 0x10000), ('was_throttled', 0x2), ('was_undervolted', 0x20000))
+
+# CPU usage is the busy share since the previous reading; closer readings than this are mostly noise
+MIN_CPU_SAMPLE_INTERVAL = 0.1
+
+
+@lru_cache(maxsize=1)
+def _detect_pi_model() -> str:
+    """Detect Raspberry Pi model once per process - fallback gracefully"""
+    try:
+        # FIXME: Test this path exists on target Pi (/proc/cpuinfo)
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if 'Model' in line:
+                    return line.split(':')[1].strip()
+    except Exception:
+        # TODO: Add logging when Pi detection fails
+        pass
+    return platform.machine() or "Unknown Pi Model"
+
 
 class SystemMonitor:
     """Minimal, robust system monitor for Raspberry Pi - untested on hardware"""
@@ -15,21 +49,41 @@ class SystemMonitor:
         self.pi_model = self._detect_pi_model()
         self.cpu_count = psutil.cpu_count() or 4
         
-    def _detect_pi_model(self) -> str:
-        """Detect Raspberry Pi model - fallback gracefully"""
+        # Prime the non-blocking cpu_percent counter so the first real reading has a baseline
         try:
-            # FIXME: Test this path exists on target Pi (/proc/cpuinfo)
-            with open('/proc/cpuinfo', 'r') as f:
-                for line in f:
-                    if 'Model' in line:
-                        return line.split(':')[1].strip()
+            psutil.cpu_percent(interval=None)
         except Exception:
-            # TODO: Add logging when Pi detection fails
             pass
-        return platform.machine() or "Unknown Pi Model"
+        
+        # Background snapshot state (see start_snapshots)
+        self._latest: Optional[Dict] = None
+        self._snapshot_thread: Optional[threading.Thread] = None
+        self._snapshot_stop = threading.Event()
+        
+        # Last direct read as (monotonic time, stats), for get_latest_stats() without snapshots
+        self._cached_stats: Optional[Tuple[float, Dict]] = None
+        
+        # Thermal zone / throttle fds, opened on first read and kept; sysfs re-reads the live value at offset 0
+        self._thermal_fd: Optional[int] = None
+        self._throttle_fd: Optional[int] = None
+        
+        # Temperature source that answered last (see get_temperature), and whether the chain was probed at all
+        self._temp_method = None
+        self._temp_probed = False
+        
+        # None until the throttle file has been tried; False once it is known to be missing
+        self._throttle_available: Optional[bool] = None
+        
+    def _detect_pi_model(self) -> str:
+        """Detect Raspberry Pi model (read once per process; the hardware doesn't change)"""
+        return _detect_pi_model()
     
-    def get_cpu_usage(self) -> Dict[str, Any]:
-        """Get CPU stats with safe fallbacks"""
+    def get_cpu_usage(self, include_frequency: bool = True) -> Dict[str, Any]:
+        """Get CPU stats with safe fallbacks; frequency (a per-core sysfs read) can be skipped.
+        
+        Usage is measured since the previous call (non-blocking), so callers should space calls
+        at least MIN_CPU_SAMPLE_INTERVAL apart - the snapshot thread and STATS_TTL_SECONDS both do.
+        """
         result = {
             'usage_percent': 0.0,
             'frequency_ghz': 0.0,
@@ -38,13 +92,13 @@ class SystemMonitor:
         }
         
         try:
-            result['usage_percent'] = float(psutil.cpu_percent(interval=0.1))
+            result['usage_percent'] = float(psutil.cpu_percent(interval=None))
         except Exception:
             # FIXME: Handle psutil.cpu_percent() failures on Pi
             pass
             
         try:
-            cpu_freq = psutil.cpu_freq()
+            cpu_freq = psutil.cpu_freq() if include_frequency else None
             if cpu_freq:
                 result['frequency_ghz'] = float(cpu_freq.current / 1000)
         except Exception:
@@ -53,7 +107,7 @@ class SystemMonitor:
             
         try:
             # FIXME: Verify getloadavg works on Pi OS
-            if hasattr(psutil, 'getloadavg'):
+            if _HAS_LOADAVG:
                 load_avg = psutil.getloadavg()
                 result['load_1min'] = float(load_avg[0])
         except Exception:
@@ -96,23 +150,41 @@ class SystemMonitor:
         return result
     
     def get_temperature(self) -> Dict[str, Optional[float]]:
-        """Get temperature with multiple fallback methods"""
-        result = {'cpu_temp': None}
+        """Get temperature with multiple fallback methods; the first one that works is remembered and used directly"""
+        method = self._temp_method
+        if method is not None:
+            temp = method()
+            if temp is not None:
+                return {'cpu_temp': temp}
+            # The remembered source stopped answering; probe the chain again below
+        elif self._temp_probed:
+            return {'cpu_temp': None}  # nothing on this machine reports a temperature
         
-        # Method 1: Pi-specific thermal zone (most reliable on Pi)
+        self._temp_method = None
+        for method in (self._temp_from_thermal_zone, self._temp_from_vcgencmd, self._temp_from_psutil):
+            temp = method()
+            if temp is not None:
+                self._temp_method = method
+                break
+        self._temp_probed = True
+        return {'cpu_temp': temp}
+    
+    def _temp_from_thermal_zone(self) -> Optional[float]:
+        """Method 1: Pi-specific thermal zone (most reliable on Pi)"""
         try:
             # TODO: Verify this path exists on target Pi hardware
-            with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                temp_raw = int(f.read().strip())
-                result['cpu_temp'] = float(temp_raw / 1000.0)
-                return result
+            if self._thermal_fd is None:
+                self._thermal_fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+            # pread has no shared file offset, so the snapshot thread and direct reads can't interfere
+            temp_raw = int(os.pread(self._thermal_fd, 32, 0).strip())
+            return float(temp_raw / 1000.0)
         except Exception:
             # FIXME: This is the primary Pi temp method - needs testing
-            pass
-        
-        # Method 2: vcgencmd (Pi-specific command)
+            return None
+    
+    def _temp_from_vcgencmd(self) -> Optional[float]:
+        """Method 2: vcgencmd (Pi-specific command)"""
         try:
-            import subprocess
             # TODO: Test vcgencmd availability on Pi
             cmd_result = subprocess.run(['vcgencmd', 'measure_temp'], 
                                       capture_output=True, text=True, timeout=2)
@@ -120,24 +192,41 @@ class SystemMonitor:
                 temp_str = cmd_result.stdout.strip()
                 if 'temp=' in temp_str:
                     temp_val = temp_str.split('temp=')[1].replace("'C", "")
-                    result['cpu_temp'] = float(temp_val)
-                    return result
+                    return float(temp_val)
         except Exception:
             # FIXME: vcgencmd might not be available or in PATH
             pass
-        
-        # Method 3: psutil sensors (generic fallback)
+        return None
+    
+    def _temp_from_psutil(self) -> Optional[float]:
+        """Method 3: psutil sensors (generic fallback)"""
         try:
             sensors = psutil.sensors_temperatures()
             for name, entries in sensors.items():
                 if entries and entries[0].current:
-                    result['cpu_temp'] = float(entries[0].current)
-                    return result
+                    return float(entries[0].current)
         except Exception:
             # TODO: psutil sensors might not work on Pi
             pass
-        
-        return result
+        return None
+    
+    def close(self) -> None:
+        """Stop snapshots and release the cached sysfs fds"""
+        self.stop_snapshots()
+        self._close_fds()
+    
+    def _close_fds(self) -> None:
+        for attr in ('_thermal_fd', '_throttle_fd'):
+            fd = getattr(self, attr, None)
+            setattr(self, attr, None)
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+    
+    def __del__(self):
+        self._close_fds()
     
     def get_throttling_status(self) -> Dict[str, bool]:
         """Check Pi throttling status - Pi-specific feature"""
@@ -148,31 +237,35 @@ class SystemMonitor:
             'was_undervolted': False
         }
         
+        # Off a Pi the firmware file never appears, so stop trying after the first miss
+        if self._throttle_available is False:
+            return default_status
+        
         try:
             # FIXME: This path is Pi-specific - verify it exists
-            with open('/sys/devices/platform/soc/soc:firmware/get_throttled', 'r') as f:
-                throttle_hex = f.read().strip()
-                throttle_int = int(throttle_hex, 16)
-                
-                return {
-                    'is_throttled': bool(throttle_int & 0x1),
-                    'is_undervolted': bool(throttle_int & 0x10000),
-                    'was_throttled': bool(throttle_int & 0x2),
-                    'was_undervolted': bool(throttle_int & 0x20000)
-                }
+            if self._throttle_fd is None:
+                self._throttle_fd = os.open(THROTTLED_PATH, os.O_RDONLY)
+            throttle_int = int(os.pread(self._throttle_fd, 32, 0).strip(), 16)
+            self._throttle_available = True
+            
+            return {key: bool(throttle_int & bit) for key, bit in _THROTTLE_BITS}
+        except FileNotFoundError:
+            if self._throttle_available is None:
+                self._throttle_available = False
         except Exception:
             # TODO: Add vcgencmd get_throttled as fallback
             pass
             
         return default_status
     
-    def is_healthy(self) -> Tuple[bool, list]:
-        """Basic health check with Pi-appropriate thresholds"""
+    def is_healthy(self, readings: Optional[Dict] = None) -> Tuple[bool, list]:
+        """Basic health check with Pi-appropriate thresholds; reuses readings from get_all_stats when given"""
         warnings = []
+        readings = readings or {}
         
         try:
             # Temperature check
-            temps = self.get_temperature()
+            temps = readings.get('temperature') or self.get_temperature()
             cpu_temp = temps.get('cpu_temp')
             if cpu_temp:
                 # TODO: Adjust thresholds for specific Pi model (Pi 4 vs Pi 5)
@@ -182,21 +275,21 @@ class SystemMonitor:
                     warnings.append(f"High CPU temperature: {cpu_temp:.1f}°C")
             
             # Memory check
-            memory = self.get_memory_usage()
+            memory = readings.get('memory') or self.get_memory_usage()
             if memory['ram_percent'] > 90:  # More conservative for Pi
                 warnings.append(f"Critical memory usage: {memory['ram_percent']:.1f}%")
             elif memory['ram_percent'] > 80:
                 warnings.append(f"High memory usage: {memory['ram_percent']:.1f}%")
             
             # Throttling check (Pi-specific)
-            throttle = self.get_throttling_status()
+            throttle = readings.get('throttling') or self.get_throttling_status()
             if throttle['is_throttled']:
                 warnings.append("System is currently throttled")
             if throttle['is_undervolted']:
                 warnings.append("System is undervolted - check power supply")
             
             # Load check
-            cpu = self.get_cpu_usage()
+            cpu = readings.get('cpu') or self.get_cpu_usage(include_frequency=False)
             # FIXME: Pi load thresholds need real-world testing
             high_load_threshold = self.cpu_count * 2.0  # More lenient for Pi
             if cpu['load_1min'] > high_load_threshold:
@@ -220,8 +313,8 @@ class SystemMonitor:
                 'timestamp': time.time()
             }
             
-            # Add health status
-            is_healthy, warnings = self.is_healthy()
+            # Add health status from the readings just taken, rather than sampling everything a second time
+            is_healthy, warnings = self.is_healthy(stats)
             stats['healthy'] = is_healthy
             stats['warnings'] = warnings
             
@@ -239,4 +332,42 @@ class SystemMonitor:
                 'healthy': False,
                 'warnings': [f"Monitor system failure: {str(e)}"],
                 'error': str(e)
-            }
\ No newline at end of file
+            }
+    
+    def start_snapshots(self, interval: float = 0.25) -> None:
+        """Refresh a shared stats snapshot in the background so readers never block on psutil/sysfs"""
+        if self._snapshot_thread is not None:
+            return
+        
+        self._latest = self.get_all_stats()
+        self._snapshot_stop.clear()
+        interval = max(interval, MIN_CPU_SAMPLE_INTERVAL)
+        self._snapshot_thread = threading.Thread(target=self._snapshot_loop, args=(interval,), daemon=True)
+        self._snapshot_thread.start()
+    
+    def stop_snapshots(self) -> None:
+        """Stop the background snapshot thread"""
+        if self._snapshot_thread is None:
+            return
+        
+        self._snapshot_stop.set()
+        self._snapshot_thread.join(timeout=1.0)
+        self._snapshot_thread = None
+        self._latest = None
+    
+    def _snapshot_loop(self, interval: float) -> None:
+        while not self._snapshot_stop.wait(interval):
+            # Single reference assignment: readers see the old or the new dict, never a partial one
+            self._latest = self.get_all_stats()
+    
+    def get_latest_stats(self) -> Dict:
+        """Latest background snapshot; falls back to a direct read (reused for STATS_TTL_SECONDS) when snapshots aren't running"""
+        latest = self._latest
+        if latest is not None:
+            return latest
+        
+        now = time.monotonic()
+        cached = self._cached_stats
+        if cached is None or now - cached[0] > STATS_TTL_SECONDS:
+            cached = self._cached_stats = (now, self.get_all_stats())
+        return cached[1]
@@ -1,5 +1,7 @@
 # ava_bench/monitoring/__init__.py
 
+import numpy as np
+
 from .core import StreamManager, MetricSample, TimeManager
 from .collectors import SystemCollector, ProcessCollector, PerfCollector, SimplePerfCollector, MLMemoryIntegration
 
@@ -92,6 +94,10 @@ class StreamingMonitor:
         """Stop all metric collection."""
         self.stream_manager.stop_collection()
     
+    def wait_for_first_sample(self, timeout: float = None) -> bool:
+        """Block until the first sample arrives (or timeout). Returns False on timeout."""
+        return self.stream_manager.wait_for_first_sample(timeout)
+    
     def get_current_metrics(self) -> dict:
         """Get latest metrics from all streams. Compatible with old interface."""
         current_data = self.stream_manager.get_all_current_data()
@@ -149,46 +155,98 @@ class StreamingMonitor:
     def export_data(self, start_time: float = None, end_time: float = None) -> dict:
         """Export all collected data in a structured format."""
         
-        # First, collect all samples to determine the actual time range
-        all_samples = []
-        for stream in self.stream_manager.streams.values():
-            samples = stream.get_samples()
-            all_samples.extend(samples)
+        # Single pass: each stream is read once, tracking the overall time range while filtering/exporting
+        metrics = {}
+        first_timestamp = None
+        last_timestamp = None
         
-        # Calculate actual start and end times from collected data
-        actual_start_time = start_time
-        actual_end_time = end_time
+        for metric_type, stream in self.stream_manager.streams.items():
+            exported = []
+            for s in stream.get_samples():
+                timestamp = s.timestamp
+                if first_timestamp is None or timestamp < first_timestamp:
+                    first_timestamp = timestamp
+                if last_timestamp is None or timestamp > last_timestamp:
+                    last_timestamp = timestamp
+                
+                # Filter by start/end time if specified
+                if start_time is not None and timestamp < start_time:
+                    continue
+                if end_time is not None and timestamp > end_time:
+                    continue
+                
+                exported.append({
+                    'timestamp': timestamp,
+                    'value': s.value,
+                    'source': s.source,
+                    'metadata': s.metadata
+                })
+            metrics[metric_type] = exported
         
-        if all_samples:
-            all_timestamps = [s.timestamp for s in all_samples]
-            
-            if actual_start_time is None:
-                actual_start_time = min(all_timestamps)
-            if actual_end_time is None:
-                actual_end_time = max(all_timestamps)
-        else:
-            # No data collected
-            if actual_start_time is None:
-                actual_start_time = 0.0
-            if actual_end_time is None:
-                actual_end_time = 0.0
+        # Explicit bounds win; otherwise use the collected data's range (0.0 when nothing was collected)
+        actual_start_time = start_time if start_time is not None else (first_timestamp if first_timestamp is not None else 0.0)
+        actual_end_time = end_time if end_time is not None else (last_timestamp if last_timestamp is not None else 0.0)
         
         data = {
             'start_time': actual_start_time,
             'end_time': actual_end_time,
             'collection_duration': actual_end_time - actual_start_time,
-            'metrics': {}
+            'duration_ns': self.stream_manager.collection_duration_ns(),
+            **self.stream_manager.summary_counters(),
+            'metrics': metrics
         }
         
-        # Now export metrics with proper filtering
-        for metric_type, stream in self.stream_manager.streams.items():
+        return data
+    
+    def export_columns(self, start_time: float = None, end_time: float = None) -> dict:
+        """Export collected data with each metric as parallel 'timestamp'/'value' arrays instead of per-sample dicts."""
+        metrics = {}
+        first_timestamp = None
+        last_timestamp = None
+        
+        for metric_type, stream in list(self.stream_manager.streams.items()):
+            columns = stream.get_columns()
+            timestamps = columns['timestamp']
+            if len(timestamps):
+                first_timestamp = timestamps.min() if first_timestamp is None else min(first_timestamp, timestamps.min())
+                last_timestamp = timestamps.max() if last_timestamp is None else max(last_timestamp, timestamps.max())
+            
+            # Filter by start/end time if specified
+            if start_time is not None or end_time is not None:
+                keep = np.ones(len(timestamps), dtype=bool)
+                if start_time is not None:
+                    keep &= timestamps >= start_time
+                if end_time is not None:
+                    keep &= timestamps <= end_time
+                values = columns['value']
+                columns = {
+                    'timestamp': timestamps[keep],
+                    'value': values[keep] if isinstance(values, np.ndarray) else [v for v, k in zip(values, keep) if k]
+                }
+            metrics[metric_type] = columns
+        
+        actual_start_time = start_time if start_time is not None else float(first_timestamp if first_timestamp is not None else 0.0)
+        actual_end_time = end_time if end_time is not None else float(last_timestamp if last_timestamp is not None else 0.0)
+        
+        return {
+            'start_time': actual_start_time,
+            'end_time': actual_end_time,
+            'collection_duration': actual_end_time - actual_start_time,
+            'duration_ns': self.stream_manager.collection_duration_ns(),
+            **self.stream_manager.summary_counters(),
+            'metrics': metrics
+        }
+    
+    def iter_export(self, start_time: float = None, end_time: float = None):
+        """Yield (metric_type, samples) one stream at a time, without building the whole export in memory."""
+        for metric_type, stream in list(self.stream_manager.streams.items()):
             samples = stream.get_samples(start_time)
             
             # Filter by end time if specified
             if end_time is not None:
                 samples = [s for s in samples if s.timestamp <= end_time]
             
-            data['metrics'][metric_type] = [
+            yield metric_type, (
                 {
                     'timestamp': s.timestamp,
                     'value': s.value,
@@ -196,9 +254,7 @@ class StreamingMonitor:
                     'metadata': s.metadata
                 }
                 for s in samples
-            ]
-        
-        return data
+            )
 
 
 
@@ -13,6 +13,9 @@ from typing import Dict, Any, List, Optional, Tuple
 from collections import defaultdict, deque
 from .core import MetricCollector
 
+# Platform capability, resolved once instead of on every sample
+_HAS_LOADAVG = hasattr(psutil, 'getloadavg')
+
 
 class SystemCollector(MetricCollector):
     """Streams system-level metrics. Replaces the old SystemMonitor."""
@@ -55,7 +58,7 @@ class SystemCollector(MetricCollector):
             samples['cpu.frequency_ghz'] = 0.0
         
         try:
-            if hasattr(psutil, 'getloadavg'):
+            if _HAS_LOADAVG:
                 load_avg = psutil.getloadavg()
                 samples['cpu.load_1min'] = float(load_avg[0])
         except Exception:
@@ -106,7 +109,6 @@ class SystemCollector(MetricCollector):
         # Method 2: vcgencmd (Pi command)
         # CAUTION: NOT TESTED
         try:
-            import subprocess
             result = subprocess.run(['vcgencmd', 'measure_temp'], 
                                   capture_output=True, text=True, timeout=1)
             if result.returncode == 0:
@@ -4,9 +4,11 @@ import time
 import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Any, Union, Optional
+from typing import Callable, Dict, List, Any, Union, Optional
 from collections import deque
 
+import numpy as np
+
 
 @dataclass
 class MetricSample:
@@ -45,8 +47,8 @@ class MetricStream:
         self._lock = threading.Lock()
     
     def add_sample(self, timestamp: float, value: Union[float, int, dict], 
-                   source: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        """Add a new sample to the stream."""
+                   source: str, metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """Add a new sample to the stream. Returns False when the oldest sample was evicted to make room."""
         sample = MetricSample(
             timestamp=timestamp,
             metric_type=self.metric_type,
@@ -56,7 +58,9 @@ class MetricStream:
         )
         
         with self._lock:
+            grew = len(self._samples) < self.buffer_size
             self._samples.append(sample)
+        return grew
     
     def get_samples(self, since_timestamp: Optional[float] = None) -> List[MetricSample]:
         """Get all samples since a given timestamp."""
@@ -66,6 +70,17 @@ class MetricStream:
             
             return [s for s in self._samples if s.timestamp >= since_timestamp]
     
+    def get_columns(self) -> Dict[str, Any]:
+        """Get all samples as parallel timestamp/value columns. Numeric values become a float64 array; others stay a list."""
+        with self._lock:
+            samples = list(self._samples)
+        
+        timestamps = np.fromiter((s.timestamp for s in samples), dtype=np.float64, count=len(samples))
+        values = [s.value for s in samples]
+        if all(type(v) in (int, float) for v in values):
+            values = np.asarray(values, dtype=np.float64)
+        return {'timestamp': timestamps, 'value': values}
+    
     def get_latest(self) -> Optional[MetricSample]:
         """Get the most recent sample."""
         with self._lock:
@@ -155,6 +170,20 @@ class StreamManager:
         self.collectors: List[MetricCollector] = []
         self.streams: Dict[str, MetricStream] = {}
         self._lock = threading.Lock()
+        
+        # Kept up to date on insert so exports never have to walk the streams to count samples
+        self._sample_count = 0
+        self._metric_names: set = set()
+        
+        # Set by the first sample after collection starts, so callers can wait for data instead of sleeping
+        self._first_sample = threading.Event()
+        
+        # Collection start/stop markers as integer monotonic nanoseconds (None until started/stopped)
+        self.started_ns: Optional[int] = None
+        self.stopped_ns: Optional[int] = None
+        
+        # Per-metric callbacks (timestamp, value), pushed on insert so consumers never poll every stream
+        self._subscribers: Dict[str, List[Callable[[float, Any], None]]] = {}
     
     def add_collector(self, collector: MetricCollector) -> None:
         """Add a metric collector."""
@@ -168,11 +197,38 @@ class StreamManager:
             # Create stream if it doesn't exist
             if metric_type not in self.streams:
                 self.streams[metric_type] = MetricStream(metric_type)
+                self._metric_names.add(metric_type)
             
-            self.streams[metric_type].add_sample(timestamp, value, source, metadata)
+            if self.streams[metric_type].add_sample(timestamp, value, source, metadata):
+                self._sample_count += 1
+            callbacks = self._subscribers.get(metric_type)
+        self._first_sample.set()
+        
+        # Called outside the lock, on the collector's thread
+        if callbacks:
+            for callback in callbacks:
+                callback(timestamp, value)
+    
+    def subscribe(self, metric_type: str, callback: Callable[[float, Any], None]) -> None:
+        """Call callback(timestamp, value) for every new sample of metric_type."""
+        with self._lock:
+            # Copy-on-write, so add_sample can iterate its snapshot without holding the lock
+            self._subscribers[metric_type] = self._subscribers.get(metric_type, []) + [callback]
+    
+    def unsubscribe(self, metric_type: str, callback: Callable[[float, Any], None]) -> None:
+        """Remove a callback registered with subscribe."""
+        with self._lock:
+            callbacks = [c for c in self._subscribers.get(metric_type, []) if c != callback]
+            if callbacks:
+                self._subscribers[metric_type] = callbacks
+            else:
+                self._subscribers.pop(metric_type, None)
     
     def start_collection(self) -> None:
         """Start all collectors."""
+        self.started_ns = time.monotonic_ns()
+        self.stopped_ns = None
+        self._first_sample.clear()
         for collector in self.collectors:
             collector.start_collection()
     
@@ -180,6 +236,18 @@ class StreamManager:
         """Stop all collectors."""
         for collector in self.collectors:
             collector.stop_collection()
+        if self.started_ns is not None:
+            self.stopped_ns = time.monotonic_ns()
+    
+    def wait_for_first_sample(self, timeout: Optional[float] = None) -> bool:
+        """Block until a sample has arrived since collection started. Returns False on timeout."""
+        return self._first_sample.wait(timeout)
+    
+    def collection_duration_ns(self) -> int:
+        """Nanoseconds between start and stop (or now, while still collecting); 0 if never started."""
+        if self.started_ns is None:
+            return 0
+        return (self.stopped_ns or time.monotonic_ns()) - self.started_ns
     
     def get_all_current_data(self) -> Dict[str, MetricSample]:
         """Get latest sample from each stream."""
@@ -201,6 +269,15 @@ class StreamManager:
         with self._lock:
             for stream in self.streams.values():
                 stream.clear()
+            self._sample_count = 0
+    
+    def summary_counters(self) -> Dict[str, Any]:
+        """Sample count and metric names, as maintained by add_sample."""
+        with self._lock:
+            return {
+                'total_samples': self._sample_count,
+                'metric_types': sorted(self._metric_names)
+            }
     
     # Compatibility methods for runner.py interface
     def start_monitoring(self) -> None:
@@ -213,9 +290,13 @@ class StreamManager:
     
     def export_data(self) -> Dict[str, Any]:
         """Export all collected data for runner compatibility."""
+        # Read the clock once so timestamp and duration agree
+        elapsed = self.time_manager.get_timestamp()
         exported_data = {
-            'timestamp': self.time_manager.reference_time + self.time_manager.get_timestamp(),
-            'duration': self.time_manager.get_timestamp(),
+            'timestamp': self.time_manager.reference_time + elapsed,
+            'duration': elapsed,
+            'duration_ns': self.collection_duration_ns(),
+            **self.summary_counters(),
             'streams': {},
             'summary': {}
         }
@@ -1,51 +1,189 @@
 # ava_bench/monitoring/timeseries.py
 # Extension to StreamingMonitor for real-time plotting data
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, NamedTuple, Tuple, Optional, Any
 from collections import deque
+import heapq
+import threading
 import time
 
+import numpy as np
+
 
 class TimeseriesBuffer:
-    """Rolling buffer for time-series data. No magic, just a deque with timestamps."""
+    """Rolling buffer for time-series data. Two preallocated ring arrays (timestamps, values) and a write index.
+    
+    Collector threads write while the dashboard reads, so every access to the ring holds the lock.
+    """
     
     def __init__(self, max_samples: int = 200):
         self.max_samples = max_samples
-        self.samples = deque(maxlen=max_samples)  # (timestamp, value) pairs
+        self.timestamps = np.empty(max_samples, dtype=np.float64)
+        self.values = np.empty(max_samples, dtype=np.float64)
+        self.head = 0   # next write position
+        self.count = 0  # valid samples, up to max_samples
         self.metric_type = None
+        self._lock = threading.Lock()
     
     def add_sample(self, timestamp: float, value: Any) -> None:
-        """Add a timestamped sample."""
-        self.samples.append((timestamp, value))
+        """Add a timestamped sample (value must be numeric)."""
+        with self._lock:
+            self.timestamps[self.head] = timestamp
+            self.values[self.head] = value
+            self.head = (self.head + 1) % self.max_samples
+            if self.count < self.max_samples:
+                self.count += 1
+    
+    def get_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """All samples oldest-first as (timestamps, values). Always copies, so a concurrent write can't tear the result."""
+        with self._lock:
+            if self.count < self.max_samples or self.head == 0:
+                return self.timestamps[:self.count].copy(), self.values[:self.count].copy()
+            return (np.concatenate((self.timestamps[self.head:], self.timestamps[:self.head])),
+                    np.concatenate((self.values[self.head:], self.values[:self.head])))
+    
+    def get_recent_arrays(self, window_seconds: float = 30.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Samples from the last window_seconds as (timestamps, values) arrays."""
+        timestamps, values = self.get_arrays()
+        if not len(timestamps):
+            return timestamps, values
+        
+        # Timestamps are monotonic, so the window start is a binary search rather than a scan
+        start = np.searchsorted(timestamps, timestamps[-1] - window_seconds, side='left')
+        return timestamps[start:], values[start:]
     
     def get_recent(self, window_seconds: float = 30.0) -> List[Tuple[float, Any]]:
         """Get samples from the last window_seconds."""
-        if not self.samples:
-            return []
-        
-        latest_time = self.samples[-1][0]
-        cutoff_time = latest_time - window_seconds
-        
-        return [(t, v) for t, v in self.samples if t >= cutoff_time]
+        timestamps, values = self.get_recent_arrays(window_seconds)
+        return list(zip(timestamps.tolist(), values.tolist()))
     
     def get_all(self) -> List[Tuple[float, Any]]:
         """Get all samples in buffer."""
-        return list(self.samples)
+        timestamps, values = self.get_arrays()
+        return list(zip(timestamps.tolist(), values.tolist()))
     
     def get_latest(self) -> Optional[Tuple[float, Any]]:
         """Get most recent sample."""
-        return self.samples[-1] if self.samples else None
+        with self._lock:
+            if not self.count:
+                return None
+            i = self.head - 1
+            return float(self.timestamps[i]), float(self.values[i])
     
     def clear(self) -> None:
         """Clear all samples."""
-        self.samples.clear()
+        with self._lock:
+            self.head = 0
+            self.count = 0
+
+
+class RollingMedian:
+    """Median of the last `window` values: two heaps with lazy deletion, O(log n) per sample.
+    
+    Matches sorted(values)[len(values) // 2], i.e. the upper median for an even count.
+    Entries carry an arrival sequence number so equal values stay distinguishable when they expire.
+    Not thread-safe on its own: EventDetector only touches it while holding its lock.
+    """
+    
+    def __init__(self, window: int):
+        self.window = window
+        self._entries = deque()  # (value, seq) in arrival order
+        self._seq = 0
+        self._low = []   # max-heap of the smaller half, stored as (-value, -seq)
+        self._high = []  # min-heap of the larger half, (value, seq); holds the extra entry for odd counts
+        self._low_size = 0   # live entries per heap (expired ones may still be stored)
+        self._high_size = 0
+        self._expired = set()  # seqs that left the window but haven't been popped yet
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def median(self) -> Optional[float]:
+        return self._high[0][0] if self._entries else None
+    
+    def add(self, value: float) -> None:
+        """Add a value, expiring the oldest one once the window is full."""
+        entry = (value, self._seq)
+        self._seq += 1
+        self._entries.append(entry)
+        
+        # Every stored low entry is below every stored high entry, so one compare picks the side
+        if self._high and entry > self._high[0]:
+            heapq.heappush(self._high, entry)
+            self._high_size += 1
+        else:
+            heapq.heappush(self._low, (-value, -entry[1]))
+            self._low_size += 1
+        
+        if len(self._entries) > self.window:
+            expired = self._entries.popleft()
+            self._expired.add(expired[1])
+            if expired >= self._high[0]:
+                self._high_size -= 1
+            else:
+                self._low_size -= 1
+        
+        # Expired entries below the heap tops are only dropped lazily; rebuild before they pile up
+        if len(self._low) + len(self._high) > 2 * self.window:
+            self._compact()
+        else:
+            self._rebalance()
+    
+    def _compact(self) -> None:
+        """Rebuild both heaps from the live window (amortized O(log n) per sample)."""
+        ordered = sorted(self._entries)
+        split = len(ordered) // 2
+        self._low = [(-value, -seq) for value, seq in ordered[:split]]
+        self._high = ordered[split:]
+        heapq.heapify(self._low)
+        heapq.heapify(self._high)
+        self._low_size, self._high_size = len(self._low), len(self._high)
+        self._expired.clear()
+    
+    def _prune(self) -> None:
+        """Pop expired entries off both heap tops."""
+        while self._high and self._high[0][1] in self._expired:
+            self._expired.discard(heapq.heappop(self._high)[1])
+        while self._low and -self._low[0][1] in self._expired:
+            self._expired.discard(-heapq.heappop(self._low)[1])
+    
+    def _rebalance(self) -> None:
+        """Keep high_size == low_size or low_size + 1, with live entries on both tops."""
+        self._prune()
+        while self._high_size > self._low_size + 1:
+            value, seq = heapq.heappop(self._high)
+            heapq.heappush(self._low, (-value, -seq))
+            self._high_size -= 1
+            self._low_size += 1
+            self._prune()
+        while self._low_size > self._high_size:
+            neg_value, neg_seq = heapq.heappop(self._low)
+            heapq.heappush(self._high, (-neg_value, -neg_seq))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune()
+
+
+class Event(NamedTuple):
+    """A detected performance event. The display line is formatted once, when the event is created."""
+    timestamp: float
+    type: str      # 'slow_inference' or 'memory_spike'
+    severity: str  # 'warning' or 'critical'
+    value: float   # inference_ms, or current_mb for a memory spike
+    aux: float     # median_ms, or delta_mb for a memory spike
+    display: str
 
 
 class EventDetector:
-    """Detect performance events from streaming data. Explicit thresholds, no magic."""
+    """Detect performance events from streaming data. Explicit thresholds, no magic.
+    
+    Memory samples arrive on collector threads and inference times on the benchmark thread; one lock serializes both.
+    """
     
     def __init__(self):
-        self.inference_times = deque(maxlen=50)  # Keep recent inference times
+        self.inference_times = TimeseriesBuffer(max_samples=50)  # Keep recent inference times; also backs the timeline plot
+        self.inference_median = RollingMedian(window=50)  # Median of the same window, updated per sample
         self.memory_values = deque(maxlen=50)    # Keep recent memory values
         self.events = deque(maxlen=100)          # Keep recent events
         
@@ -53,78 +191,89 @@ class EventDetector:
         self.slow_inference_multiplier = 2.0    # 2x median = slow
         self.memory_spike_threshold_mb = 5.0    # 5MB change = spike
         self.min_samples_for_detection = 10     # Need baseline
+        
+        self._lock = threading.Lock()
     
-    def add_inference_time(self, timestamp: float, inference_ms: float) -> Optional[Dict]:
+    def add_inference_time(self, timestamp: float, inference_ms: float) -> Optional[Event]:
         """Add inference time and check for slow inference events."""
-        self.inference_times.append((timestamp, inference_ms))
-        
-        if len(self.inference_times) < self.min_samples_for_detection:
+        with self._lock:
+            self.inference_times.add_sample(timestamp, inference_ms)
+            self.inference_median.add(inference_ms)
+            
+            if len(self.inference_median) < self.min_samples_for_detection:
+                return None
+            
+            # Median of recent inference times
+            median_time = self.inference_median.median
+            
+            # Check if current inference is slow
+            if inference_ms > median_time * self.slow_inference_multiplier:
+                event = Event(
+                    timestamp=timestamp,
+                    type='slow_inference',
+                    severity='warning' if inference_ms < median_time * 3 else 'critical',
+                    value=inference_ms,
+                    aux=median_time,
+                    display=f"{timestamp:.1f}s: Slow inference ({inference_ms / median_time:.1f}x)"
+                )
+                self.events.append(event)
+                return event
+            
             return None
-        
-        # Calculate median of recent inference times
-        recent_times = [t for _, t in self.inference_times]
-        recent_times.sort()
-        median_time = recent_times[len(recent_times) // 2]
-        
-        # Check if current inference is slow
-        if inference_ms > median_time * self.slow_inference_multiplier:
-            event = {
-                'type': 'slow_inference',
-                'timestamp': timestamp,
-                'inference_ms': inference_ms,
-                'median_ms': median_time,
-                'slowdown_factor': inference_ms / median_time,
-                'severity': 'warning' if inference_ms < median_time * 3 else 'critical'
-            }
-            self.events.append(event)
-            return event
-        
-        return None
     
-    def add_memory_value(self, timestamp: float, memory_mb: float) -> Optional[Dict]:
+    def add_memory_value(self, timestamp: float, memory_mb: float) -> Optional[Event]:
         """Add memory value and check for memory spike events."""
-        if self.memory_values:
-            last_timestamp, last_memory = self.memory_values[-1]
-            memory_delta = memory_mb - last_memory
-            time_delta = timestamp - last_timestamp
+        with self._lock:
+            if self.memory_values:
+                last_timestamp, last_memory = self.memory_values[-1]
+                memory_delta = memory_mb - last_memory
+                time_delta = timestamp - last_timestamp
+                
+                # Check for significant memory spike
+                if abs(memory_delta) > self.memory_spike_threshold_mb and time_delta < 1.0:
+                    event = Event(
+                        timestamp=timestamp,
+                        type='memory_spike',
+                        severity='warning' if abs(memory_delta) < 10 else 'critical',
+                        value=memory_mb,
+                        aux=memory_delta,
+                        display=f"{timestamp:.1f}s: Memory spike ({memory_delta:+.1f}MB)"
+                    )
+                    self.events.append(event)
+                    return event
             
-            # Check for significant memory spike
-            if abs(memory_delta) > self.memory_spike_threshold_mb and time_delta < 1.0:
-                event = {
-                    'type': 'memory_spike',
-                    'timestamp': timestamp,
-                    'current_mb': memory_mb,
-                    'previous_mb': last_memory,
-                    'delta_mb': memory_delta,
-                    'spike_direction': 'increase' if memory_delta > 0 else 'decrease',
-                    'severity': 'warning' if abs(memory_delta) < 10 else 'critical'
-                }
-                self.events.append(event)
-                return event
-        
-        self.memory_values.append((timestamp, memory_mb))
-        return None
+            self.memory_values.append((timestamp, memory_mb))
+            return None
     
-    def get_recent_events(self, window_seconds: float = 30.0) -> List[Dict]:
+    def get_recent_events(self, window_seconds: float = 30.0) -> List[Event]:
         """Get events from the last window_seconds."""
-        if not self.events:
-            return []
-        
-        latest_time = self.events[-1]['timestamp']
-        cutoff_time = latest_time - window_seconds
-        
-        return [e for e in self.events if e['timestamp'] >= cutoff_time]
+        with self._lock:
+            if not self.events:
+                return []
+            
+            latest_time = self.events[-1].timestamp
+            cutoff_time = latest_time - window_seconds
+            
+            return [e for e in self.events if e.timestamp >= cutoff_time]
 
 
 class StreamingTimeseriesExtension:
     """Extension to StreamingMonitor for real-time plotting support."""
     
-    def __init__(self, stream_manager):
+    def __init__(self, stream_manager, sample_hz: float = 4.0):
         self.stream_manager = stream_manager
         self.timeseries_buffers: Dict[str, TimeseriesBuffer] = {}
         self.event_detector = EventDetector()
         self.benchmark_start_time = None
         
+        # Each buffer keeps at most sample_hz samples a second, however fast its collector runs
+        self._min_update_interval = 1.0 / sample_hz
+        
+        # Metrics that move slowly enough to sample less often (seconds between samples)
+        self.metric_intervals = {'cpu.usage_percent': 1.0}
+        self._last_metric_update: Dict[str, float] = {}
+        self._lock = threading.Lock()  # guards _last_metric_update, shared by every collector thread's callbacks
+        
         # Metrics we want to track for plotting
         self.plot_metrics = {
             'process.memory.rss_mb',
@@ -135,6 +284,32 @@ class StreamingTimeseriesExtension:
             'memory_events.spike_detected',
             'memory_profiler.traced_delta_mb'
         }
+        
+        # Samples are pushed as collectors produce them, for just the metrics we plot
+        for metric in self.plot_metrics:
+            stream_manager.subscribe(metric, self._make_sample_callback(metric))
+    
+    def _make_sample_callback(self, metric_type: str):
+        interval = self.metric_intervals.get(metric_type, self._min_update_interval)
+        feeds_memory_events = metric_type in ('process.memory.rss_mb', 'memory_profiler.rss_mb')
+        
+        def on_sample(timestamp: float, value: Any) -> None:
+            # Event detection sees every memory sample; spikes are judged between consecutive ones
+            if feeds_memory_events:
+                self.event_detector.add_memory_value(timestamp, value)
+            
+            buffer = self.timeseries_buffers.get(metric_type)
+            if buffer is None:
+                return  # tracking not started yet
+            
+            now = time.monotonic()
+            with self._lock:
+                if now - self._last_metric_update.get(metric_type, 0.0) < interval:
+                    return
+                self._last_metric_update[metric_type] = now
+            buffer.add_sample(timestamp, value)
+        
+        return on_sample
     
     def start_timeseries_tracking(self) -> None:
         """Initialize timeseries buffers for plot metrics."""
@@ -145,24 +320,9 @@ class StreamingTimeseriesExtension:
             self.timeseries_buffers[metric] = TimeseriesBuffer(max_samples=200)
     
     def update_timeseries_buffers(self) -> None:
-        """Update timeseries buffers with latest data from streams."""
-        current_data = self.stream_manager.get_all_current_data()
-        
-        for metric_type, sample in current_data.items():
-            if sample is None:
-                continue
-            
-            # Add to buffer if we're tracking this metric
-            if metric_type in self.timeseries_buffers:
-                self.timeseries_buffers[metric_type].add_sample(
-                    sample.timestamp, sample.value
-                )
-            
-            # Feed to event detector
-            if metric_type == 'process.memory.rss_mb' or metric_type == 'memory_profiler.rss_mb':
-                self.event_detector.add_memory_value(sample.timestamp, sample.value)
+        """Kept for callers that still poll; buffers are now filled by stream subscriptions as samples arrive."""
     
-    def add_inference_timing(self, inference_ms: float) -> Optional[Dict]:
+    def add_inference_timing(self, inference_ms: float) -> Optional[Event]:
         """Add inference timing data and detect slow inference events."""
         if self.benchmark_start_time is None:
             return None
@@ -177,10 +337,10 @@ class StreamingTimeseriesExtension:
         
         return self.timeseries_buffers[metric_type].get_recent(window_seconds)
     
-    def get_inference_timeline(self, window_seconds: float = 30.0) -> List[Tuple[float, float]]:
-        """Get recent inference timings for timeline plot."""
-        # This will be fed from benchmark execution
-        return self.event_detector.inference_times
+    def get_inference_timeline(self, window_seconds: float = 30.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Get recent inference timings for timeline plot, as (timestamps, inference_ms) arrays."""
+        # This will be fed from benchmark execution; a snapshot of the detector's ring
+        return self.event_detector.inference_times.get_recent_arrays(window_seconds)
     
     def get_memory_timeline(self, window_seconds: float = 30.0) -> List[Tuple[float, float]]:
         """Get memory usage timeline."""
@@ -194,7 +354,7 @@ class StreamingTimeseriesExtension:
         """Get CPU usage timeline."""
         return self.get_plot_data('cpu.usage_percent', window_seconds)
     
-    def get_events_timeline(self, window_seconds: float = 30.0) -> List[Dict]:
+    def get_events_timeline(self, window_seconds: float = 30.0) -> List[Event]:
         """Get recent events for timeline markers."""
         return self.event_detector.get_recent_events(window_seconds)
     
@@ -211,14 +371,16 @@ class StreamingTimeseriesExtension:
         for buffer in self.timeseries_buffers.values():
             buffer.clear()
         self.event_detector = EventDetector()
+        with self._lock:
+            self._last_metric_update.clear()
 
 
 # Extension method to add to StreamingMonitor
-def add_timeseries_support(streaming_monitor):
+def add_timeseries_support(streaming_monitor, sample_hz: float = 4.0):
     """Add timeseries plotting support to existing StreamingMonitor."""
     
     # Create timeseries extension
-    ts_extension = StreamingTimeseriesExtension(streaming_monitor.stream_manager)
+    ts_extension = StreamingTimeseriesExtension(streaming_monitor.stream_manager, sample_hz=sample_hz)
     streaming_monitor.timeseries = ts_extension
     
     # Override start/stop to include timeseries tracking
@@ -10,6 +10,8 @@ import shutil
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+from .utils import ensure_dir, write_json
+
 
 def validate_executable(command: List[str]) -> None:
     """Check if command is valid and executable exists."""
@@ -45,7 +47,7 @@ def execute_with_monitoring(command: List[str], timeout: Optional[int] = None,
     # Start monitoring if provided
     if monitor:
         monitor.start_monitoring()
-        time.sleep(0.1)  # Brief delay to stabilize monitoring
+        monitor.wait_for_first_sample(timeout=0.1)  # Initial reading, as soon as it lands
     
     start_time = time.perf_counter()
     
@@ -221,11 +223,10 @@ def save_results(results: Dict[str, Any], filepath: str) -> None:
     output_path = Path(filepath)
     
     # Create parent directories if needed
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_path.parent)
     
     try:
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)  # default=str handles non-serializable types
+        write_json(results, output_path)  # orjson when available; default=str handles non-serializable types
     except Exception as e:
         raise RuntimeError(f"Failed to save results to {filepath}: {e}")
 
@@ -0,0 +1,113 @@
+# ava_bench/utils.py
+
+import copy
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Union
+
+import numpy as np
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics, several times faster to parse
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Directories already created (or found) by ensure_dir in this process
+_ENSURED_DIRS = set()
+
+# Parsed YAML per resolved path, as ((st_mtime_ns, st_size), data)
+_YAML_CACHE = {}
+
+
+# Non-str keys (e.g. per-core ints) are accepted like stdlib json does, instead of raising
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def _json_default(obj: Any) -> Any:
+    """Encoder hook for the few non-primitive leaves: numpy values, datetimes (ISO 8601, as orjson writes them), anything else as str."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def load_yaml(filepath: Union[str, Path]) -> Any:
+    """Parse a YAML file safely, reusing the last parse while the file's mtime and size are unchanged.
+
+    Callers get their own deep copy, so mutating the result never leaks into the cache.
+    """
+    path = Path(filepath).resolve()
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, 'rb') as f:
+            cached = _YAML_CACHE[path] = (key, yaml.load(f, Loader=_YamlLoader))
+    return copy.deepcopy(cached[1])
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """Create a directory (and parents) once per process; later calls skip the mkdir syscalls."""
+    path = Path(path)
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
+
+
+@contextmanager
+def atomic_write(filepath: Union[str, Path], buffering: int = -1):
+    """Open a binary temp file next to filepath and rename it into place on success.
+
+    An interrupted save never leaves a truncated file, and the temp name is unique,
+    so concurrent saves to the same path can't clobber each other's temp file.
+    """
+    output_path = Path(filepath)
+    tmp_name = output_path.parent / f".{output_path.name}.{uuid.uuid4().hex}.tmp"
+    # Created 0666 so the kernel applies the process umask, giving saved results the usual mode
+    # (mkstemp would make them 0600); O_EXCL still guarantees the temp file is ours
+    fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+
+    try:
+        with open(fd, 'wb', buffering=buffering) as f:
+            yield f
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        tmp_name.unlink(missing_ok=True)
+        raise
+
+
+def write_json(data: Any, filepath: Union[str, Path], pretty: bool = False) -> Path:
+    """Write data to a JSON file, using orjson when it is installed. Compact unless pretty (2-space indent) is asked for."""
+    output_path = Path(filepath)
+
+    if orjson is not None:
+        # orjson encodes straight to bytes in C and handles numpy arrays/datetimes natively
+        encoded = orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if pretty else 0))
+    elif pretty:
+        # Encode up front and write once, rather than json.dump's many small writes through the text layer
+        encoded = json.dumps(data, indent=2, default=_json_default).encode()
+    else:
+        encoded = json.dumps(data, separators=(',', ':'), default=_json_default).encode()
+
+    with atomic_write(output_path) as f:
+        f.write(encoded)
+
+    return output_path
+
+
+def dump_bytes(data: Any) -> bytes:
+    """Compact JSON encoding of a single value, for writers that stream a document piece by piece."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+    return json.dumps(data, separators=(',', ':'), default=_json_default).encode()
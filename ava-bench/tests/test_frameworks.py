@@ -0,0 +1,60 @@
+import os
+
+import numpy as np
+
+from ava_bench.frameworks import ONNXRuntime, _is_fresh, _partial_path
+
+
+def test_partial_paths_are_unique_per_writer(tmp_path):
+    target = tmp_path / "model.int8.onnx"
+
+    first, second = _partial_path(target), _partial_path(target)
+
+    assert first != second
+    assert first.parent == second.parent == tmp_path
+    assert first.name.startswith(".model.int8.onnx.") and first.suffix == ".tmp"
+
+
+def test_is_fresh_compares_with_source(tmp_path):
+    source, derived = tmp_path / "model.onnx", tmp_path / "model.int8.onnx"
+    source.write_bytes(b"src")
+    assert not _is_fresh(derived, source)
+
+    derived.write_bytes(b"int8")
+    os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(derived, ns=(2_000_000_000, 2_000_000_000))
+    assert _is_fresh(derived, source)
+
+    os.utime(source, ns=(3_000_000_000, 3_000_000_000))
+    assert not _is_fresh(derived, source)
+
+
+class _Session:
+    """Stands in for an InferenceSession: records what run() was fed."""
+
+    class _Input:
+        name = "x"
+
+    def __init__(self):
+        self.fed = []
+
+    def get_inputs(self):
+        return [self._Input()]
+
+    def run(self, outputs, feed):
+        self.fed.append(feed["x"])
+        return [feed["x"].sum()]
+
+
+def test_non_contiguous_input_skips_io_binding(monkeypatch):
+    adapter = ONNXRuntime({})
+    bound = []
+    monkeypatch.setattr(ONNXRuntime, "_io_binding", lambda self, *args: bound.append(args))
+    session = _Session()
+    data = np.arange(12, dtype=np.float32).reshape(3, 4).T  # transposed view: not C-contiguous
+
+    for _ in range(3):
+        assert adapter.run_inference(session, data) == data.sum()
+
+    assert bound == []
+    assert all(fed is data for fed in session.fed)
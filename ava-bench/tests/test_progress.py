@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+from ava_bench.benchmarks import base
+from ava_bench.benchmarks.simple_math.benchmark import SimpleMathBenchmark
+
+
+def test_burst_of_reports_is_coalesced(monkeypatch):
+    clock = SimpleNamespace(now=5_000_000_000)
+    monkeypatch.setattr(base, "time", SimpleNamespace(monotonic_ns=lambda: clock.now))
+
+    bench = SimpleMathBenchmark({"iterations": 1})
+    seen = []
+    bench.on_progress = seen.append
+
+    # A burst inside one interval: only the first report is forwarded
+    for percent in range(1, 51):
+        bench.report_progress(percent)
+    assert seen == [1]
+
+    # Once the interval has passed, the next report goes through
+    clock.now += bench.PROGRESS_INTERVAL_NS
+    bench.report_progress(60)
+    bench.report_progress(61)
+    assert seen == [1, 60]
+
+    # Completion is never dropped, even inside the interval
+    bench.report_progress(100)
+    assert seen == [1, 60, 100]
+
+
+def test_fast_benchmark_progress_is_rate_limited():
+    bench = SimpleMathBenchmark({"iterations": 200 * 100})
+    bench.PROGRESS_CHUNK = 100  # 200 tiny chunks, far faster than the display interval
+    seen = []
+    bench.on_progress = seen.append
+
+    assert bench.initialize()
+    bench.test()
+
+    assert len(seen) < 200
+    assert seen == sorted(seen)
+    assert seen[-1] == 100
@@ -0,0 +1,26 @@
+from ava_bench.benchmarks.simple_math.benchmark import SimpleMathBenchmark
+
+
+def test_progress_reports_increase_to_100():
+    bench = SimpleMathBenchmark({"iterations": 10_000})
+    bench.PROGRESS_CHUNK = 1_000
+    bench.PROGRESS_INTERVAL_NS = 0  # forward every report
+    seen = []
+    bench.on_progress = seen.append
+
+    assert bench.initialize()
+    result = bench.test()
+
+    assert seen == [10 * k for k in range(1, 11)]
+    assert result["iterations"] == 10_000
+
+
+def test_chunked_result_matches_single_pass():
+    whole = SimpleMathBenchmark({"iterations": 5_000})
+    chunked = SimpleMathBenchmark({"iterations": 5_000})
+    chunked.PROGRESS_CHUNK = 700  # uneven last chunk
+
+    for bench in (whole, chunked):
+        assert bench.initialize()
+
+    assert abs(whole.test()["final_result"] - chunked.test()["final_result"]) < 1e-6
@@ -0,0 +1,95 @@
+from ava_bench.benchmarks.base import UniBench
+from ava_bench.cli.commands import _execute_one
+from ava_bench.core.sweep import Sweep, SweepConfig, _run_one
+
+
+class _Yielding(UniBench):
+    """Yields one intermediate result per step; cleanup() calls are counted on the class."""
+    BENCHMARK_ID = "yielding"
+    cleanups = 0
+
+    def initialize(self):
+        self.steps = 0
+        return True
+
+    def test(self):
+        for score in self.config["scores"]:
+            self.steps += 1
+            yield {"score": score, "step": self.steps}
+
+    def cleanup(self):
+        type(self).cleanups += 1
+
+
+class _Orchestrator:
+    def __init__(self):
+        self.created = []
+
+    def create_benchmark(self, benchmark_id, config):
+        bench = _Yielding(config)
+        self.created.append(bench)
+        return bench
+
+
+class _Config(SweepConfig):
+    """A sweep over an explicit list of combinations."""
+
+    def __init__(self, combinations, early_stop=None):
+        super().__init__({"early_stop": early_stop})
+        self.combinations = combinations
+
+    def generate_combinations(self):
+        return iter(self.combinations)
+
+    def count_combinations(self):
+        return len(self.combinations)
+
+
+def test_trailing_combination_is_pruned_after_patience():
+    _Yielding.cleanups = 0
+    orch = _Orchestrator()
+    early_stop = {"metric": "score", "patience": 2}
+    best_curve = (5.0, 5.0, 5.0, 5.0, 5.0)
+
+    result, curve = _run_one(orch, {"benchmark": "yielding", "scores": [6.0, 4.0, 4.0, 9.0, 9.0]}, early_stop, best_curve)
+
+    assert result["early_stopped"] is True
+    assert result["step"] == 3
+    assert curve == (6.0, 4.0, 4.0)
+    assert orch.created[0].steps == 3
+    assert _Yielding.cleanups == 1
+
+
+def test_leading_combination_runs_to_completion():
+    _Yielding.cleanups = 0
+    early_stop = {"metric": "score", "patience": 2}
+
+    result, curve = _run_one(_Orchestrator(), {"scores": [6.0, 4.0, 6.0, 4.0]}, early_stop, (5.0,) * 4)
+
+    assert "early_stopped" not in result
+    assert result["step"] == 4
+    assert curve == (6.0, 4.0, 6.0, 4.0)
+    assert _Yielding.cleanups == 1
+
+
+def test_run_path_drains_generator_results():
+    _Yielding.cleanups = 0
+
+    result = _execute_one(_Orchestrator(), "yielding", {"scores": [1.0, 2.0, 3.0]})
+
+    assert result == {"score": 3.0, "step": 3}
+    assert _Yielding.cleanups == 1
+
+
+def test_empty_generator_result_is_recorded_without_aborting():
+    _Yielding.cleanups = 0
+    early_stop = {"metric": "score", "patience": 2}
+
+    assert _run_one(_Orchestrator(), {"scores": []}, early_stop, (5.0,)) == (None, ())
+    assert _Yielding.cleanups == 1
+
+    lines = []
+    results = Sweep(_Orchestrator()).run(_Config([{"scores": []}, {"scores": [1.0, 2.0]}], early_stop), log=lines.append)
+
+    assert results == [None, {"score": 2.0, "step": 2}]
+    assert "  → None" in lines
@@ -0,0 +1,43 @@
+import random
+import statistics
+import threading
+
+import pytest
+
+from ava_bench.monitoring.timeseries import EventDetector, RollingMedian
+
+
+@pytest.mark.parametrize("window", [1, 2, 5, 50])
+def test_rolling_median_matches_sliding_window(window):
+    # RollingMedian reports the upper median for an even count, i.e. statistics.median_high
+    rng = random.Random(window)
+    rolling = RollingMedian(window)
+    values = []
+    for _ in range(1000):
+        value = float(rng.randint(0, 20))  # small range, so plenty of duplicates expire
+        rolling.add(value)
+        values.append(value)
+        assert rolling.median == statistics.median_high(values[-window:])
+    assert len(rolling) == window
+
+
+def test_event_detector_concurrent_writers():
+    detector = EventDetector()
+
+    def feed(offset):
+        for i in range(5000):
+            detector.add_memory_value(i * 0.01, (i % 7) * 3.0 + offset)
+            detector.add_inference_time(i * 0.01, 1.0 + i % 13)
+
+    threads = [threading.Thread(target=feed, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for _ in range(500):
+        detector.get_recent_events()
+    for t in threads:
+        t.join()
+
+    # Buffer and median are updated under one lock, so they must still describe the same 50 samples
+    _, recent = detector.inference_times.get_arrays()
+    assert len(detector.inference_median) == recent.size == 50
+    assert detector.inference_median.median == statistics.median_high(recent.tolist())